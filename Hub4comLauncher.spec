@@ -1,11 +1,19 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+import os
+import subprocess
+import sys
+
+# Ship a theme.qss that matches theme.py; a stale one would be rendered live at every start
+if subprocess.call([sys.executable, os.path.join(SPECPATH, 'tools', 'bake_theme.py'), '--check']) != 0:
+    raise SystemExit('ui/theme/theme.qss is out of date; run python tools/bake_theme.py first')
+
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('ui/theme/theme.qss', 'ui/theme')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
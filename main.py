@@ -9,9 +9,10 @@ Main entry point for the application
 
 import sys
 from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu 
-from PyQt6.QtGui import QPalette, QColor, QIcon, QPixmap, QPainter, QBrush, QPen, QLinearGradient, QAction
+from PyQt6.QtGui import QPalette, QColor, QIcon, QPixmap, QPixmapCache, QPainter, QBrush, QPen, QLinearGradient, QAction
 from PyQt6.QtCore import Qt
 from ui.gui import Hub4comGUI
+from ui.theme.theme import ThemeManager
 
 
 def create_app_icon():
@@ -77,6 +78,10 @@ def main():
     app.setApplicationName("Hub4com Launcher with Port Scanner & Baud Rate Support")
     app.setApplicationVersion("0.1")
 
+    # Apply the application-wide stylesheet once, before any widget is created
+    ThemeManager.apply_global_stylesheet(app)
+    QPixmapCache.setCacheLimit(20480)  # KB; holds the rendered SVG icons
+
     # Create system tray icon
     app_icon = create_app_icon()
     tray_icon = QSystemTrayIcon(app_icon)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Bake the theme stylesheet into ui/theme/theme.qss
+
+Run after changing colors, dimensions or QSS templates in ui/theme/theme.py:
+    python tools/bake_theme.py          # regenerate theme.qss
+    python tools/bake_theme.py --check  # exit 1 if theme.qss is out of date
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ui.theme.theme import AppStyles, BAKED_QSS_PATH, baked_qss_header  # noqa: E402
+
+
+def render() -> str:
+    """Stylesheet as it would be generated live"""
+    return baked_qss_header() + AppStyles.application_qss()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bake the theme stylesheet into theme.qss")
+    parser.add_argument("--check", action="store_true",
+                        help="only verify that theme.qss matches the live stylesheet")
+    args = parser.parse_args()
+
+    qss = render()
+    if not qss.isascii():
+        # ui/theme/theme.py reads the baked file back as Latin-1
+        print("stylesheet contains non-ASCII characters; escape them in the QSS templates")
+        return 1
+    if args.check:
+        try:
+            # Universal newlines: a CRLF checkout of theme.qss is still up to date
+            with open(BAKED_QSS_PATH, encoding="latin-1") as f:
+                baked = f.read()
+        except FileNotFoundError:
+            baked = None
+        if baked != qss:
+            print(f"{BAKED_QSS_PATH} is out of date; run tools/bake_theme.py")
+            return 1
+        print(f"{BAKED_QSS_PATH} is up to date")
+        return 0
+
+    with open(BAKED_QSS_PATH, "w", encoding="ascii", newline="") as f:
+        f.write(qss)
+    print(f"Wrote {BAKED_QSS_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,7 +9,7 @@ from typing import Tuple, Optional
 from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton
 from PyQt6.QtCore import Qt
 
-from ui.theme.theme import ThemeManager, AppStyles, AppDimensions, AppColors, AppFonts
+from ui.theme.theme import ThemeManager, AppDimensions, AppColors, AppFonts
 
 
 class PairCreationDialog(QDialog):
@@ -49,12 +49,12 @@ class PairCreationDialog(QDialog):
         # Port A input
         port_a_layout = QHBoxLayout()
         port_a_label = QLabel("Port A Name:")
-        port_a_label.setStyleSheet(AppStyles.label())
+        ThemeManager.set_variant(port_a_label)
         port_a_layout.addWidget(port_a_label)
         
         self.port_a_input = QLineEdit()
         self.port_a_input.setPlaceholderText("e.g., COM5 or leave empty")
-        self.port_a_input.setStyleSheet(AppStyles.lineedit())
+        ThemeManager.set_variant(self.port_a_input)
         port_a_layout.addWidget(self.port_a_input)
         
         layout.addLayout(port_a_layout)
@@ -62,12 +62,12 @@ class PairCreationDialog(QDialog):
         # Port B input
         port_b_layout = QHBoxLayout()
         port_b_label = QLabel("Port B Name:")
-        port_b_label.setStyleSheet(AppStyles.label())
+        ThemeManager.set_variant(port_b_label)
         port_b_layout.addWidget(port_b_label)
         
         self.port_b_input = QLineEdit()
         self.port_b_input.setPlaceholderText("e.g., COM6 or leave empty")
-        self.port_b_input.setStyleSheet(AppStyles.lineedit())
+        ThemeManager.set_variant(self.port_b_input)
         port_b_layout.addWidget(self.port_b_input)
         
         layout.addLayout(port_b_layout)
@@ -76,12 +76,12 @@ class PairCreationDialog(QDialog):
         buttons = QHBoxLayout()
         
         self.create_btn = QPushButton("Create")
-        self.create_btn.setStyleSheet(AppStyles.button("primary"))
+        ThemeManager.set_variant(self.create_btn, "primary")
         self.create_btn.clicked.connect(self.accept)
         buttons.addWidget(self.create_btn)
         
         self.cancel_btn = QPushButton("Cancel")
-        self.cancel_btn.setStyleSheet(AppStyles.button())
+        ThemeManager.set_variant(self.cancel_btn)
         self.cancel_btn.clicked.connect(self.reject)
         buttons.addWidget(self.cancel_btn)
         
@@ -12,11 +12,10 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushBut
                              QTableWidget, QTableWidgetItem, QGroupBox, QTextEdit,
                              QMessageBox, QFileDialog, QHeaderView)
 from PyQt6.QtCore import QTimer, Qt, QSize
-from PyQt6.QtGui import QColor
 
 from core.components import (ResponsiveWindowManager, SerialPortInfo, PortScanner, 
                            WINREG_AVAILABLE)
-from ui.theme.theme import AppFonts, AppColors, ThemeManager, AppStyles, AppDimensions
+from ui.theme.theme import AppFonts, AppQColors, ThemeManager, AppDimensions
 
 
 class PortScanDialog(QDialog):
@@ -71,7 +70,7 @@ class PortScanDialog(QDialog):
         scan_layout.addStretch()
         
         self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet(AppStyles.label())
+        ThemeManager.set_variant(self.status_label)
         scan_layout.addWidget(self.status_label)
         
         layout.addLayout(scan_layout)
@@ -80,7 +79,7 @@ class PortScanDialog(QDialog):
         self.table = QTableWidget()
         self.table.setColumnCount(4)
         self.table.setHorizontalHeaderLabels(["Port", "Type", "Device Name", "Description"])
-        self.table.setStyleSheet(AppStyles.tablewidget())
+        ThemeManager.set_variant(self.table)
         
         # Set column widths
         header = self.table.horizontalHeader()
@@ -95,13 +94,13 @@ class PortScanDialog(QDialog):
         
         # Details section
         details_group = QGroupBox("Port Details")
-        details_group.setStyleSheet(AppStyles.groupbox())
+        ThemeManager.set_variant(details_group)
         details_layout = QVBoxLayout(details_group)
         
         self.details_text = QTextEdit()
         self.details_text.setMaximumHeight(AppDimensions.HEIGHT_TEXT_SMALL)
         self.details_text.setFont(AppFonts.CONSOLE)
-        self.details_text.setStyleSheet(AppStyles.textedit())
+        ThemeManager.set_variant(self.details_text)
         details_layout.addWidget(self.details_text)
         
         layout.addWidget(details_group)
@@ -173,11 +172,11 @@ class PortScanDialog(QDialog):
             # Port type with color coding
             type_item = QTableWidgetItem(port.port_type)
             if port.port_type == "Physical":
-                type_item.setBackground(QColor(AppColors.ACCENT_BLUE))
+                type_item.setBackground(AppQColors.ACCENT_BLUE)
             elif port.port_type == "Virtual (Moxa)":
-                type_item.setBackground(QColor(AppColors.ACCENT_PURPLE))
+                type_item.setBackground(AppQColors.ACCENT_PURPLE)
             else:
-                type_item.setBackground(QColor(AppColors.PAIR_HIGHLIGHT))
+                type_item.setBackground(AppQColors.PAIR_HIGHLIGHT)
             self.table.setItem(row, 1, type_item)
             
             # Device name
@@ -6,7 +6,7 @@ Contains the primary application interface - Fully themed version
 
 import json
 from pathlib import Path
-from typing import Optional, List, Dict, Callable
+from typing import Optional, List, Dict, Callable, Final
 from functools import partial
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
@@ -23,8 +23,8 @@ from core.components import (
     WINREG_AVAILABLE, PortConfig, Com0comProcess, DefaultConfig
 )
 from ui.theme.theme import (
-    ThemeManager, AppStyles, AppFonts, AppDimensions, AppColors, 
-    AppMessages, IconManager
+    ThemeManager, AppFonts, AppDimensions, AppColors, 
+    AppMessages, IconManager, fill_pair_tooltip
 )
 from ui.dialogs import PortScanDialog, Com0ComHelpDialog, PairCreationDialog, ConfigurationSummaryDialog, LaunchDialog
 from ui.widgets import OutputPortWidget
@@ -36,11 +36,11 @@ from ui.widgets import OutputPortWidget
 
 class Config:
     """Application configuration constants"""
-    BAUD_RATES = ["1200", "2400", "4800", "9600", "14400", "19200", 
-                  "38400", "57600", "115200", "230400", "460800", "921600"]
-    QUICK_BAUD_RATES = ["9600", "19200", "38400", "57600", "115200"]
-    DEFAULT_BAUD = "115200"
-    MIN_OUTPUT_PORTS = 1
+    BAUD_RATES: Final = ("1200", "2400", "4800", "9600", "14400", "19200",
+                         "38400", "57600", "115200", "230400", "460800", "921600")
+    QUICK_BAUD_RATES: Final = ("9600", "19200", "38400", "57600", "115200")
+    DEFAULT_BAUD: Final = "115200"
+    MIN_OUTPUT_PORTS: Final = 1
 
 
 # ============================================================================
@@ -98,14 +98,12 @@ class Hub4comGUI(QMainWindow):
     
     def _create_central_widget(self):
         """Create scrollable central widget"""
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet(AppStyles.scroll_area())
+        scroll_area = ThemeManager.configure_scroll_area(QScrollArea())
         
         central_widget = QWidget()
-        central_widget.setStyleSheet(f"QWidget {{ background-color: {AppColors.BACKGROUND_LIGHT}; }}")
+        # Scoped to the container itself so themed children keep their global styles
+        central_widget.setObjectName("centralWidget")
+        central_widget.setStyleSheet(f"QWidget#centralWidget {{ background-color: {AppColors.BACKGROUND_LIGHT}; }}")
         scroll_area.setWidget(central_widget)
         self.setCentralWidget(scroll_area)
         
@@ -594,13 +592,13 @@ class Hub4comGUI(QMainWindow):
         """Update the port type indicator using theme messages"""
         current_port = self.incoming_port.currentData()
         if not current_port:
-            self.incoming_port_type.setText("")
+            self.incoming_port_type.clear_port_type()
             self.incoming_port_type.setVisible(False)
             return
         
         port_info = next((p for p in self.scanned_ports if p.port_name == current_port), None)
         if not port_info:
-            self.incoming_port_type.setText("")
+            self.incoming_port_type.clear_port_type()
             self.incoming_port_type.setVisible(False)
             return
         
@@ -615,8 +613,8 @@ class Hub4comGUI(QMainWindow):
             text = AppMessages.PORT_TYPE_VIRTUAL
             style_type = "info"
         
-        self.incoming_port_type.setText(text)
-        self.incoming_port_type.setStyleSheet(AppStyles.port_type_indicator(style_type))
+        self.incoming_port_type.set_port_type(text)
+        ThemeManager.set_variant(self.incoming_port_type, f"port_type_{style_type}")
         self.incoming_port_type.setVisible(True)
     # ========================================================================
     # HUB4COM MANAGEMENT
@@ -1145,7 +1143,7 @@ class Hub4comGUI(QMainWindow):
         
         # Create list item
         item = QListWidgetItem(main_text)
-        tooltip = AppMessages.PAIR_TOOLTIP_TEMPLATE.format(
+        tooltip = fill_pair_tooltip(
             port_a=port_a, 
             params_a=params_a or 'Standard settings (no special features)',
             port_b=port_b, 
@@ -3,8 +3,68 @@
 SVG Icon Definitions for Hub4com GUI
 """
 
+from typing import Dict, Tuple
+
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QIcon, QPainter, QPixmap, QPixmapCache
+from PyQt6.QtSvg import QSvgRenderer
+
+# Parsed SVG documents, keyed by (icon_id, color); a renderer can draw into any painter
+_RENDERER_CACHE: Dict[Tuple[str, str], QSvgRenderer] = {}
+
+
+def _renderer(icon_id: str, color: str) -> QSvgRenderer:
+    """Long-lived renderer for an icon, so its SVG is only parsed once"""
+    key = (icon_id, color)
+    renderer = _RENDERER_CACHE.get(key)
+    if renderer is None:
+        renderer = QSvgRenderer(AppIcons.svg_bytes(icon_id, color))
+        _RENDERER_CACHE[key] = renderer
+    return renderer
+
+
 class AppIcons:
     """SVG icon definitions matching Windows 10 system style"""
+
+    # Rendered icons, keyed by (icon_id, width, height, color)
+    _icon_cache: Dict[Tuple[str, int, int, str], QIcon] = {}
+
+    @classmethod
+    def svg_bytes(cls, icon_id: str, color: str) -> bytes:
+        """SVG source of an icon with its color placeholder filled in"""
+        return getattr(cls, icon_id).format(color=color).encode("utf-8")
+
+    @classmethod
+    def rendered_pixmap(cls, icon_id: str, size: QSize, color: str) -> QPixmap:
+        """Rasterize an icon, reusing earlier renders through the global QPixmapCache"""
+        key = f"app:{icon_id}:{size.width()}x{size.height()}:{color}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(size)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            _renderer(icon_id, color).render(painter)
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    @classmethod
+    def icon(cls, icon_id: str, size: QSize, color: str) -> QIcon:
+        """Single-color QIcon for an icon, built once per id, size and color"""
+        key = (icon_id, size.width(), size.height(), color)
+        icon = cls._icon_cache.get(key)
+        if icon is None:
+            icon = QIcon(cls.rendered_pixmap(icon_id, size, color))
+            cls._icon_cache[key] = icon
+        return icon
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all rendered icons, e.g. after the icon colors changed"""
+        cls._icon_cache.clear()
+        _RENDERER_CACHE.clear()
+        QPixmapCache.clear()
+
     LIST = """
     <svg viewBox="0 0 16 16" xmlns="http://www.w3.org/2000/svg">
         <!-- Windows 10 style list/view icon -->
@@ -6,19 +6,42 @@ Matches exact Windows 10 system conventions for all UI elements
 Based on official Microsoft design specifications and system measurements
 """
 
-from PyQt6.QtGui import QFont, QColor, QIcon, QPixmap, QPainter
-from PyQt6.QtCore import QSize, QRect, Qt
-from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtGui import QFont, QColor, QIcon, QPixmap, QPainter, QPalette
+from PyQt6.QtCore import QFile, QIODevice, QMargins, QRect, QSize, Qt
 from PyQt6.QtWidgets import (QPushButton, QComboBox, QGroupBox, QTextEdit, 
                              QLineEdit, QCheckBox, QLabel, QListWidget, 
-                             QProgressBar, QWidget, QTableWidget, QFrame,
-                             QScrollArea, QDialog)
-from dataclasses import dataclass
-from typing import Dict, Any, Optional, Callable
-import math
-from .icons.icons import AppIcons
-
-@dataclass
+                             QProgressBar, QWidget, QTableWidget, QFrame)
+from typing import Dict, Any, Optional, Callable, Final, Tuple
+import functools
+import hashlib
+import os
+import re
+import string
+import sys
+from types import SimpleNamespace
+
+__all__ = [
+    "AppColors", "AppQColors", "AppRGB", "AppARGB", "AppFonts", "AppDimensions", "AppSizes",
+    "MESSAGES", "AppMessages", "fill_pair_tooltip", "port_label_text", "AppStyles", "BAKED_QSS_PATH",
+    "baked_qss_header", "IconManager", "PortTypeIndicator", "ThemeManager", "Config",
+    "AppIcons",
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _app_icons():
+    """AppIcons (all SVG sources), imported on first use instead of with the theme constants"""
+    from .icons.icons import AppIcons
+    globals()["AppIcons"] = AppIcons
+    return AppIcons
+
+
+def __getattr__(name):
+    if name == "AppIcons":
+        return _app_icons()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class AppColors:
     """Exact Windows 10 system color palette from registry and theme specifications"""
     
@@ -139,15 +162,60 @@ class AppColors:
     HIGH_CONTRAST_BUTTON_TEXT = "#ffffff"
 
 
-@dataclass
+class AppQColors:
+    """AppColors as QColor objects, parsed once instead of at every paint (treat as read-only)"""
+
+
+class AppRGB:
+    """AppColors as (r, g, b) int tuples for numeric color work"""
+
+
+class AppARGB:
+    """AppColors as opaque 0xAARRGGBB ints, for QColor.fromRgba without string parsing"""
+
+
+def _collect_color_values() -> Dict[str, int]:
+    """Opaque 0xAARRGGBB value of every AppColors constant"""
+    return {name: 0xFF000000 | int(value[1:], 16)
+            for name, value in vars(AppColors).items() if name.isupper()}
+
+
+def _fill_color_namespaces() -> None:
+    """Build AppQColors, AppRGB and AppARGB from the current AppColors"""
+    for name, argb in _collect_color_values().items():
+        setattr(AppARGB, name, argb)
+        setattr(AppRGB, name, ((argb >> 16) & 0xFF, (argb >> 8) & 0xFF, argb & 0xFF))
+        setattr(AppQColors, name, QColor.fromRgba(argb))
+
+
+_fill_color_namespaces()
+
+
+class _LazyFont:
+    """QFont class attribute built on first access, once a QApplication exists"""
+
+    def __init__(self, *args):
+        self._args = args
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, owner) -> QFont:
+        font = QFont(*self._args)
+        setattr(owner, self._name, font)  # Replace the descriptor with the font
+        return font
+
+
 class AppFonts:
     """Windows 10 system fonts - exact specifications"""
     # Windows 10 uses Segoe UI as the primary system font
-    HEADER = QFont("Segoe UI", 14, QFont.Weight.Bold)
-    CONSOLE = QFont("Consolas", 9)
-    CONSOLE_LARGE = QFont("Consolas", 10)
+    HEADER = _LazyFont("Segoe UI", 14, QFont.Weight.Bold)
+    CONSOLE = _LazyFont("Consolas", 9)
+    CONSOLE_LARGE = _LazyFont("Consolas", 10)
     DEFAULT_FAMILY = "Segoe UI"
     DEFAULT_SIZE = "9pt"      # Standard Windows 10 size
+    DEFAULT_POINT_SIZE = 9    # DEFAULT_SIZE as a QFont point size
     SMALL_SIZE = "8pt"
     CAPTION_SIZE = "11pt"     # Windows 10 caption font size
     
@@ -157,7 +225,6 @@ class AppFonts:
     ITALIC_STYLE = "italic"
 
 
-@dataclass 
 class AppDimensions:
     """Exact Windows 10 system dimensions based on Microsoft specifications"""
     
@@ -168,6 +235,7 @@ class AppDimensions:
     BUTTON_HEIGHT_SMALL = 21            # Small button height
     BUTTON_HEIGHT_MEDIUM = 23           # Medium button height (standard)
     BUTTON_HEIGHT_LARGE = 28            # Large button height
+    BUTTON_WIDTH_LARGE = BUTTON_WIDTH_STANDARD + 20     # Large primary action button width
     
     # === CHECKBOX DIMENSIONS (Windows 10 specifications) ===
     # Windows 10 checkbox: 20x20 pixels at 100% DPI, 18x18 for modern UI
@@ -180,6 +248,7 @@ class AppDimensions:
     COMBOBOX_ARROW_WIDTH = 16           # Width of dropdown arrow area
     COMBOBOX_ARROW_SIZE = 8             # Actual arrow glyph size
     COMBOBOX_MIN_WIDTH = 120            # Minimum combobox width
+    COMBOBOX_PADDING_RIGHT = COMBOBOX_ARROW_WIDTH + 4   # Text padding clear of the arrow
     
     # === ICON DIMENSIONS ===
     # Based on Windows 10 icon sizes (16x16, 20x20, 24x24, 32x32)
@@ -187,6 +256,7 @@ class AppDimensions:
     ICON_SIZE_MEDIUM = 20
     ICON_SIZE_LARGE = 24
     ICON_SIZE_XLARGE = 32
+    ICON_BUTTON_SIZE = ICON_SIZE_MEDIUM + 8             # Icon button with padding around a medium icon
     
     # === SPACING (Based on 4px grid system) ===
     SPACING_TINY = 2
@@ -236,6 +306,7 @@ class AppDimensions:
     BORDER_WIDTH_THICK = 2             # Thick border for focus
     BORDER_RADIUS_STANDARD = 0         # Windows 10 uses square corners
     BORDER_RADIUS_MODERN = 2           # Modern slight rounding
+    BORDER_RADIUS_INNER = BORDER_RADIUS_MODERN - 1      # Parts inset in a modern-rounded frame
     
     # === FOCUS RECTANGLE ===
     FOCUS_RECT_WIDTH = 1               # Focus rectangle line width
@@ -245,258 +316,328 @@ class AppDimensions:
     OUTPUT_PORT_MIN_COUNT = 1          # Minimum number of output ports
 
 
-class AppMessages:
-    """Centralized messages for consistency"""
-    READY = "Ready"
-    SCANNING = "Scanning for serial ports..."
-    NO_DEVICES = "No COM devices detected"
-    NO_DEVICES_FULL = "No COM devices detected. Please connect equipment and refresh."
-    PORT_PAIR_CREATED = "Virtual COM port pair created successfully"
-    PORT_PAIR_REMOVED = "Virtual COM port pair removed successfully"
-    HUBCOM_RUNNING = "Hub4com routing service is active - Data routing operational"
-    HUBCOM_STOPPED = "Hub4com routing service stopped"
-    ERROR_OCCURRED = "Error occurred"
-    LISTING_PAIRS = "Checking virtual COM port pairs..."
-    CREATING_PAIR = "Creating virtual COM port pair..."
-    REMOVING_PAIR = "Removing virtual COM port pair..."
-    STARTING_HUBCOM = "Starting hub4com routing service..."
-    STOPPING_HUBCOM = "Stopping hub4com routing service..."
+class AppSizes:
+    """Shared QSize instances for the standard icon dimensions (treat as read-only)"""
+    ICON_SMALL = QSize(AppDimensions.ICON_SIZE_SMALL, AppDimensions.ICON_SIZE_SMALL)
+    ICON_MEDIUM = QSize(AppDimensions.ICON_SIZE_MEDIUM, AppDimensions.ICON_SIZE_MEDIUM)
+    ICON_LARGE = QSize(AppDimensions.ICON_SIZE_LARGE, AppDimensions.ICON_SIZE_LARGE)
+    ICON_XLARGE = QSize(AppDimensions.ICON_SIZE_XLARGE, AppDimensions.ICON_SIZE_XLARGE)
+
+
+# Square icon side length -> shared AppSizes instance
+_ICON_SIZES = {size.width(): size for size in (AppSizes.ICON_SMALL, AppSizes.ICON_MEDIUM,
+                                                AppSizes.ICON_LARGE, AppSizes.ICON_XLARGE)}
+
+
+# Centralized messages for consistency; AppMessages exposes them as attributes
+MESSAGES: Dict[str, str] = {
+    "READY": "Ready",
+    "SCANNING": "Scanning for serial ports...",
+    "NO_DEVICES": "No COM devices detected",
+    "NO_DEVICES_FULL": "No COM devices detected. Please connect equipment and refresh.",
+    "PORT_PAIR_CREATED": "Virtual COM port pair created successfully",
+    "PORT_PAIR_REMOVED": "Virtual COM port pair removed successfully",
+    "HUBCOM_RUNNING": "Hub4com routing service is active - Data routing operational",
+    "HUBCOM_STOPPED": "Hub4com routing service stopped",
+    "ERROR_OCCURRED": "Error occurred",
+    "LISTING_PAIRS": "Checking virtual COM port pairs...",
+    "CREATING_PAIR": "Creating virtual COM port pair...",
+    "REMOVING_PAIR": "Removing virtual COM port pair...",
+    "STARTING_HUBCOM": "Starting hub4com routing service...",
+    "STOPPING_HUBCOM": "Stopping hub4com routing service...",
     
     # Tooltips
-    PAIR_TOOLTIP_TEMPLATE = """Port A ({port_a}): {params_a}
+    "PAIR_TOOLTIP_TEMPLATE": """Port A ({port_a}): {params_a}
 Port B ({port_b}): {params_b}
 
 Right-click or use 'Configure Features' to modify settings
-Click 'Help' button for detailed explanations of all features"""
+Click 'Help' button for detailed explanations of all features""",
     
     # Button labels
-    BUTTON_ROUTE_MODE = "Route Mode: {mode} ▼"
-    BUTTON_PORT_LABEL = "Port {number}:"
-    BUTTON_SET_ALL = "Set All:"
+    "BUTTON_ROUTE_MODE": "Route Mode: {mode} ▼",
+    "BUTTON_PORT_LABEL": "Port {number}:",
+    "BUTTON_SET_ALL": "Set All:",
     
     # Port type indicators
-    PORT_TYPE_MOXA = "🌐 MOXA Network Device - Make sure baud rate matches your source device"
-    PORT_TYPE_PHYSICAL = "🔌 PHYSICAL PORT - Connected to real hardware, verify device baud rate"
-    PORT_TYPE_VIRTUAL = "💻 VIRTUAL PORT - Software-created port for inter-application communication"
+    "PORT_TYPE_MOXA": "🌐 MOXA Network Device - Make sure baud rate matches your source device",
+    "PORT_TYPE_PHYSICAL": "🔌 PHYSICAL PORT - Connected to real hardware, verify device baud rate",
+    "PORT_TYPE_VIRTUAL": "💻 VIRTUAL PORT - Software-created port for inter-application communication",
+}
 
+AppMessages = SimpleNamespace(**MESSAGES)
 
-class AppStyles:
-    """Exact Windows 10 system stylesheets matching native controls"""
-    
-    @staticmethod
-    def button(style_variant: str = "default") -> str:
-        """Windows 10 system button - exact match to native controls"""
-        base_style = f"""
+
+# PAIR_TOOLTIP_TEMPLATE split once into its literal runs and the field names between them
+_PAIR_PARTS = list(string.Formatter().parse(AppMessages.PAIR_TOOLTIP_TEMPLATE))
+_PAIR_LITERALS = tuple(literal for literal, _, _, _ in _PAIR_PARTS)
+_PAIR_FIELDS = tuple(field for _, field, _, _ in _PAIR_PARTS if field is not None)
+if len(_PAIR_LITERALS) == len(_PAIR_FIELDS):
+    _PAIR_LITERALS += ("",)  # Template ends with a field
+del _PAIR_PARTS
+
+
+# Port type messages pre-split into (emoji, plain text) so the emoji can be drawn as a pixmap
+_PORT_TYPE_PARTS = {
+    message: tuple(message.split(" ", 1))
+    for message in (AppMessages.PORT_TYPE_MOXA, AppMessages.PORT_TYPE_PHYSICAL,
+                    AppMessages.PORT_TYPE_VIRTUAL)
+}
+
+
+def fill_pair_tooltip(port_a: str, params_a: str, port_b: str, params_b: str) -> str:
+    """Fill PAIR_TOOLTIP_TEMPLATE without re-parsing it on every call"""
+    args = {'port_a': port_a, 'params_a': params_a, 'port_b': port_b, 'params_b': params_b}
+    literals = iter(_PAIR_LITERALS)
+    return next(literals) + ''.join(args[field] + next(literals) for field in _PAIR_FIELDS)
+
+
+@functools.lru_cache(maxsize=64)
+def port_label_text(number: int) -> str:
+    """BUTTON_PORT_LABEL for one port number; only a handful of numbers ever recur"""
+    return AppMessages.BUTTON_PORT_LABEL.format(number=number)
+
+
+def _collect_style_vars() -> Dict[str, Any]:
+    """Flat name -> value map of the theme constants used to fill the QSS templates"""
+    style_vars = {
+        name: value
+        for namespace in (AppColors, AppFonts, AppDimensions)
+        for name, value in vars(namespace).items()
+        if name.isupper() and isinstance(value, (str, int))
+    }
+    return style_vars
+
+
+_STYLE_VARS = _collect_style_vars()
+
+# Semantic types with their own notification_* and port_type_* variants
+_SEMANTIC_TYPES = ("success", "warning", "error", "info")
+
+
+def _collect_semantic_colors() -> Dict[str, Dict[str, str]]:
+    """Primary, background and border colors of each semantic type"""
+    return {
+        semantic_type: {
+            element: getattr(AppColors, f"{semantic_type.upper()}_{element.upper()}")
+            for element in ("primary", "background", "border")
+        }
+        for semantic_type in _SEMANTIC_TYPES
+    }
+
+
+def _collect_notification_colors() -> Dict[str, Tuple[str, str, str]]:
+    """(background, border, text) colors of each notification type"""
+    return {semantic_type: (colors["background"], colors["border"], colors["primary"])
+            for semantic_type, colors in _SEMANTIC_COLOR_MAP.items()}
+
+
+_SEMANTIC_COLOR_MAP = _collect_semantic_colors()
+_NOTIFICATION_COLORS = _collect_notification_colors()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_semantic_color(semantic_type: str, element: str = "primary") -> str:
+    """One color of a semantic type, falling back to info / the info primary color"""
+    return _SEMANTIC_COLOR_MAP.get(semantic_type, _SEMANTIC_COLOR_MAP["info"]).get(
+        element, AppColors.INFO_PRIMARY)
+
+# QSS templates for AppStyles, rendered with str.format_map(_STYLE_VARS)
+_BUTTON_QSS = """
         QPushButton {{
-            background-color: {AppColors.BUTTON_DEFAULT};
-            color: {AppColors.TEXT_DEFAULT};
-            padding: {AppDimensions.PADDING_BUTTON_STANDARD};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            min-width: {AppDimensions.BUTTON_WIDTH_STANDARD}px;
-            min-height: {AppDimensions.BUTTON_HEIGHT_STANDARD}px;
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
+            background-color: {BUTTON_DEFAULT};
+            color: {TEXT_DEFAULT};
+            padding: {PADDING_BUTTON_STANDARD};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            min-width: {BUTTON_WIDTH_STANDARD}px;
+            min-height: {BUTTON_HEIGHT_STANDARD}px;
+            border-radius: {BORDER_RADIUS_STANDARD}px;
         }}
         QPushButton:hover {{
-            background-color: {AppColors.BUTTON_HOVER};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_FOCUS};
+            background-color: {BUTTON_HOVER};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_FOCUS};
         }}
         QPushButton:pressed {{
-            background-color: {AppColors.BUTTON_PRESSED};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_PRESSED};
+            background-color: {BUTTON_PRESSED};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_PRESSED};
         }}
         QPushButton:focus {{
-            border: {AppDimensions.BORDER_WIDTH_THICK}px solid {AppColors.BORDER_FOCUS};
+            border: {BORDER_WIDTH_THICK}px solid {BORDER_FOCUS};
             outline: none;
         }}
         QPushButton:disabled {{
-            background-color: {AppColors.BACKGROUND_DISABLED};
-            color: {AppColors.TEXT_DISABLED};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DISABLED};
+            background-color: {BACKGROUND_DISABLED};
+            color: {TEXT_DISABLED};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DISABLED};
         }}
         """
-        
-        # Add variant-specific styles
-        if style_variant == "primary":
-            base_style += f"""
+
+# Overrides appended to _BUTTON_QSS for the colored button variants
+_BUTTON_VARIANT_QSS = {
+    "primary": """
             QPushButton {{
-                background-color: {AppColors.ACCENT_BLUE};
-                color: {AppColors.TEXT_WHITE};
-                border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.ACCENT_BLUE};
+                background-color: {ACCENT_BLUE};
+                color: {TEXT_WHITE};
+                border: {BORDER_WIDTH_STANDARD}px solid {ACCENT_BLUE};
             }}
             QPushButton:hover {{
-                background-color: {AppColors.HOT_TRACKING};
-                border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.HOT_TRACKING};
+                background-color: {HOT_TRACKING};
+                border: {BORDER_WIDTH_STANDARD}px solid {HOT_TRACKING};
             }}
             QPushButton:pressed {{
-                background-color: {AppColors.BORDER_PRESSED};
-                border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_PRESSED};
+                background-color: {BORDER_PRESSED};
+                border: {BORDER_WIDTH_STANDARD}px solid {BORDER_PRESSED};
             }}
-            """
-        elif style_variant == "success":
-            base_style += f"""
+            """,
+    "success": """
             QPushButton {{
-                background-color: {AppColors.SUCCESS_PRIMARY};
-                color: {AppColors.TEXT_WHITE};
-                border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.SUCCESS_BORDER};
+                background-color: {SUCCESS_PRIMARY};
+                color: {TEXT_WHITE};
+                border: {BORDER_WIDTH_STANDARD}px solid {SUCCESS_BORDER};
             }}
             QPushButton:hover {{
-                background-color: {AppColors.SUCCESS_BORDER};
-                border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.SUCCESS_BORDER};
+                background-color: {SUCCESS_BORDER};
+                border: {BORDER_WIDTH_STANDARD}px solid {SUCCESS_BORDER};
             }}
-            """
-        elif style_variant == "danger":
-            base_style += f"""
+            """,
+    "danger": """
             QPushButton {{
-                background-color: {AppColors.ERROR_PRIMARY};
-                color: {AppColors.TEXT_WHITE};
-                border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.ERROR_BORDER};
+                background-color: {ERROR_PRIMARY};
+                color: {TEXT_WHITE};
+                border: {BORDER_WIDTH_STANDARD}px solid {ERROR_BORDER};
             }}
             QPushButton:hover {{
-                background-color: {AppColors.ERROR_BORDER};
-                border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.ERROR_BORDER};
+                background-color: {ERROR_BORDER};
+                border: {BORDER_WIDTH_STANDARD}px solid {ERROR_BORDER};
             }}
-            """
-            
-        return base_style
-    
-    @staticmethod
-    def button_large() -> str:
-        """Large button for primary actions"""
-        return f"""
+            """,
+}
+
+_BUTTON_LARGE_QSS = """
         QPushButton {{
-            background-color: {AppColors.BUTTON_DEFAULT};
-            color: {AppColors.TEXT_DEFAULT};
-            padding: {AppDimensions.PADDING_BUTTON_LARGE};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            min-width: {AppDimensions.BUTTON_WIDTH_STANDARD + 20}px;
-            min-height: {AppDimensions.BUTTON_HEIGHT_LARGE}px;
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
+            background-color: {BUTTON_DEFAULT};
+            color: {TEXT_DEFAULT};
+            padding: {PADDING_BUTTON_LARGE};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            min-width: {BUTTON_WIDTH_LARGE}px;
+            min-height: {BUTTON_HEIGHT_LARGE}px;
+            border-radius: {BORDER_RADIUS_STANDARD}px;
         }}
         QPushButton:hover {{
-            background-color: {AppColors.BUTTON_HOVER};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_FOCUS};
+            background-color: {BUTTON_HOVER};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_FOCUS};
         }}
         QPushButton:pressed {{
-            background-color: {AppColors.BUTTON_PRESSED};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_PRESSED};
+            background-color: {BUTTON_PRESSED};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_PRESSED};
         }}
         QPushButton:focus {{
-            border: {AppDimensions.BORDER_WIDTH_THICK}px solid {AppColors.BORDER_FOCUS};
+            border: {BORDER_WIDTH_THICK}px solid {BORDER_FOCUS};
             outline: none;
         }}
         QPushButton:disabled {{
-            background-color: {AppColors.BACKGROUND_DISABLED};
-            color: {AppColors.TEXT_DISABLED};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DISABLED};
+            background-color: {BACKGROUND_DISABLED};
+            color: {TEXT_DISABLED};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DISABLED};
         }}
         """
-    
-    @staticmethod
-    def button_compact() -> str:
-        """Compact button for toolbars and space-constrained areas"""
-        return f"""
+
+_BUTTON_COMPACT_QSS = """
         QPushButton {{
-            background-color: {AppColors.BUTTON_DEFAULT};
-            color: {AppColors.TEXT_DEFAULT};
-            padding: {AppDimensions.PADDING_BUTTON_COMPACT};
-            font-size: {AppFonts.SMALL_SIZE};
-            min-height: {AppDimensions.BUTTON_HEIGHT_SMALL}px;
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
+            background-color: {BUTTON_DEFAULT};
+            color: {TEXT_DEFAULT};
+            padding: {PADDING_BUTTON_COMPACT};
+            font-size: {SMALL_SIZE};
+            min-height: {BUTTON_HEIGHT_SMALL}px;
+            border-radius: {BORDER_RADIUS_STANDARD}px;
         }}
         QPushButton:hover {{
-            background-color: {AppColors.BUTTON_HOVER};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_FOCUS};
+            background-color: {BUTTON_HOVER};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_FOCUS};
         }}
         QPushButton:pressed {{
-            background-color: {AppColors.BUTTON_PRESSED};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_PRESSED};
+            background-color: {BUTTON_PRESSED};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_PRESSED};
         }}
         QPushButton:focus {{
-            border: {AppDimensions.BORDER_WIDTH_THICK}px solid {AppColors.BORDER_FOCUS};
+            border: {BORDER_WIDTH_THICK}px solid {BORDER_FOCUS};
             outline: none;
         }}
         QPushButton:disabled {{
-            background-color: {AppColors.BACKGROUND_DISABLED};
-            color: {AppColors.TEXT_DISABLED};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DISABLED};
+            background-color: {BACKGROUND_DISABLED};
+            color: {TEXT_DISABLED};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DISABLED};
         }}
         """
-    
-    @staticmethod
-    def icon_button() -> str:
-        """Icon-only button matching Windows 10 toolbar buttons"""
-        return f"""
+
+_ICON_BUTTON_QSS = """
         QPushButton {{
             background-color: transparent;
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid transparent;
-            padding: {AppDimensions.PADDING_SMALL};
-            color: {AppColors.TEXT_DEFAULT};
-            min-width: {AppDimensions.ICON_SIZE_MEDIUM + 8}px;
-            min-height: {AppDimensions.ICON_SIZE_MEDIUM + 8}px;
-            border-radius: {AppDimensions.BORDER_RADIUS_MODERN}px;
+            border: {BORDER_WIDTH_STANDARD}px solid transparent;
+            padding: {PADDING_SMALL};
+            color: {TEXT_DEFAULT};
+            min-width: {ICON_BUTTON_SIZE}px;
+            min-height: {ICON_BUTTON_SIZE}px;
+            border-radius: {BORDER_RADIUS_MODERN}px;
         }}
         QPushButton:hover {{
-            background-color: {AppColors.INFO_BACKGROUND};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_LIGHT};
+            background-color: {INFO_BACKGROUND};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_LIGHT};
         }}
         QPushButton:pressed {{
-            background-color: {AppColors.BUTTON_PRESSED};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_FOCUS};
+            background-color: {BUTTON_PRESSED};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_FOCUS};
         }}
         QPushButton:focus {{
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_FOCUS};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_FOCUS};
             outline: none;
         }}
         QPushButton:disabled {{
-            color: {AppColors.ICON_DISABLED};
+            color: {ICON_DISABLED};
             background-color: transparent;
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid transparent;
+            border: {BORDER_WIDTH_STANDARD}px solid transparent;
         }}
         """
-    
-    @staticmethod
-    def combobox() -> str:
-        """Windows 10 system combobox - exact native styling"""
-        return f"""
+
+_COMBOBOX_QSS = """
         QComboBox {{
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            padding: {AppDimensions.PADDING_SMALL} {AppDimensions.COMBOBOX_ARROW_WIDTH + 4}px {AppDimensions.PADDING_SMALL} {AppDimensions.PADDING_SMALL};
-            background-color: {AppColors.BACKGROUND_WHITE};
-            color: {AppColors.TEXT_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            min-height: {AppDimensions.COMBOBOX_HEIGHT}px;
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            padding: {PADDING_SMALL} {COMBOBOX_PADDING_RIGHT}px {PADDING_SMALL} {PADDING_SMALL};
+            background-color: {BACKGROUND_WHITE};
+            color: {TEXT_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            min-height: {COMBOBOX_HEIGHT}px;
+            border-radius: {BORDER_RADIUS_STANDARD}px;
         }}
         QComboBox:hover {{
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_FOCUS};
-            background-color: {AppColors.BACKGROUND_WHITE};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_FOCUS};
+            background-color: {BACKGROUND_WHITE};
         }}
         QComboBox:focus {{
-            border: {AppDimensions.BORDER_WIDTH_THICK}px solid {AppColors.BORDER_FOCUS};
-            background-color: {AppColors.BACKGROUND_WHITE};
+            border: {BORDER_WIDTH_THICK}px solid {BORDER_FOCUS};
+            background-color: {BACKGROUND_WHITE};
             outline: none;
         }}
         QComboBox:disabled {{
-            background-color: {AppColors.BACKGROUND_DISABLED};
-            color: {AppColors.TEXT_DISABLED};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DISABLED};
+            background-color: {BACKGROUND_DISABLED};
+            color: {TEXT_DISABLED};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DISABLED};
         }}
         QComboBox::drop-down {{
             border: none;
-            width: {AppDimensions.COMBOBOX_ARROW_WIDTH}px;
+            width: {COMBOBOX_ARROW_WIDTH}px;
             background-color: transparent;
         }}
         QComboBox::drop-down:hover {{
             background-color: rgba(0, 120, 215, 0.1);
         }}
         QComboBox::down-arrow {{
-            width: {AppDimensions.COMBOBOX_ARROW_SIZE}px;
-            height: {AppDimensions.COMBOBOX_ARROW_SIZE}px;
+            width: {COMBOBOX_ARROW_SIZE}px;
+            height: {COMBOBOX_ARROW_SIZE}px;
             image: none;
             border: none;
         }}
@@ -505,10 +646,10 @@ class AppStyles:
             top: 1px;
         }}
         QComboBox QAbstractItemView {{
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            background-color: {AppColors.BACKGROUND_WHITE};
-            selection-background-color: {AppColors.SELECTION_BG};
-            selection-color: {AppColors.SELECTION_TEXT};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            background-color: {BACKGROUND_WHITE};
+            selection-background-color: {SELECTION_BG};
+            selection-color: {SELECTION_TEXT};
             outline: none;
         }}
         QComboBox QAbstractItemView::item {{
@@ -516,556 +657,1038 @@ class AppStyles:
             padding: 2px 4px;
         }}
         QComboBox QAbstractItemView::item:hover {{
-            background-color: {AppColors.BUTTON_HOVER};
+            background-color: {BUTTON_HOVER};
         }}
         """
-    
-    @staticmethod
-    def checkbox() -> str:
-        """Windows 10 system checkbox - exact native appearance"""
-        return f"""
+
+_CHECKBOX_QSS = """
         QCheckBox {{
-            color: {AppColors.TEXT_DEFAULT};
-            spacing: {AppDimensions.SPACING_MEDIUM}px;
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
+            color: {TEXT_DEFAULT};
+            spacing: {SPACING_MEDIUM}px;
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
         }}
         QCheckBox:disabled {{
-            color: {AppColors.TEXT_DISABLED};
+            color: {TEXT_DISABLED};
         }}
         QCheckBox::indicator {{
-            width: {AppDimensions.CHECKBOX_SIZE_STANDARD}px;
-            height: {AppDimensions.CHECKBOX_SIZE_STANDARD}px;
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
+            width: {CHECKBOX_SIZE_STANDARD}px;
+            height: {CHECKBOX_SIZE_STANDARD}px;
+            border-radius: {BORDER_RADIUS_STANDARD}px;
         }}
         QCheckBox::indicator:unchecked {{
-            border: {AppDimensions.CHECKBOX_BORDER_WIDTH}px solid {AppColors.BORDER_DEFAULT};
-            background-color: {AppColors.BACKGROUND_WHITE};
+            border: {CHECKBOX_BORDER_WIDTH}px solid {BORDER_DEFAULT};
+            background-color: {BACKGROUND_WHITE};
         }}
         QCheckBox::indicator:unchecked:hover {{
-            border: {AppDimensions.CHECKBOX_BORDER_WIDTH}px solid {AppColors.BORDER_FOCUS};
-            background-color: {AppColors.BUTTON_HOVER};
+            border: {CHECKBOX_BORDER_WIDTH}px solid {BORDER_FOCUS};
+            background-color: {BUTTON_HOVER};
         }}
         QCheckBox::indicator:unchecked:pressed {{
-            border: {AppDimensions.CHECKBOX_BORDER_WIDTH}px solid {AppColors.BORDER_PRESSED};
-            background-color: {AppColors.BUTTON_PRESSED};
+            border: {CHECKBOX_BORDER_WIDTH}px solid {BORDER_PRESSED};
+            background-color: {BUTTON_PRESSED};
         }}
         QCheckBox::indicator:checked {{
-            border: {AppDimensions.CHECKBOX_BORDER_WIDTH}px solid {AppColors.ACCENT_BLUE};
-            background-color: {AppColors.ACCENT_BLUE};
+            border: {CHECKBOX_BORDER_WIDTH}px solid {ACCENT_BLUE};
+            background-color: {ACCENT_BLUE};
             image: none;
         }}
         QCheckBox::indicator:checked:hover {{
-            border: {AppDimensions.CHECKBOX_BORDER_WIDTH}px solid {AppColors.HOT_TRACKING};
-            background-color: {AppColors.HOT_TRACKING};
+            border: {CHECKBOX_BORDER_WIDTH}px solid {HOT_TRACKING};
+            background-color: {HOT_TRACKING};
         }}
         QCheckBox::indicator:checked:pressed {{
-            border: {AppDimensions.CHECKBOX_BORDER_WIDTH}px solid {AppColors.BORDER_PRESSED};
-            background-color: {AppColors.BORDER_PRESSED};
+            border: {CHECKBOX_BORDER_WIDTH}px solid {BORDER_PRESSED};
+            background-color: {BORDER_PRESSED};
         }}
         QCheckBox::indicator:indeterminate {{
-            border: {AppDimensions.CHECKBOX_BORDER_WIDTH}px solid {AppColors.ACCENT_BLUE};
-            background-color: {AppColors.ACCENT_BLUE};
+            border: {CHECKBOX_BORDER_WIDTH}px solid {ACCENT_BLUE};
+            background-color: {ACCENT_BLUE};
         }}
         QCheckBox::indicator:disabled {{
-            border: {AppDimensions.CHECKBOX_BORDER_WIDTH}px solid {AppColors.BORDER_DISABLED};
-            background-color: {AppColors.BACKGROUND_DISABLED};
+            border: {CHECKBOX_BORDER_WIDTH}px solid {BORDER_DISABLED};
+            background-color: {BACKGROUND_DISABLED};
         }}
         QCheckBox::indicator:checked:disabled {{
-            border: {AppDimensions.CHECKBOX_BORDER_WIDTH}px solid {AppColors.BORDER_DISABLED};
-            background-color: {AppColors.BORDER_DISABLED};
+            border: {CHECKBOX_BORDER_WIDTH}px solid {BORDER_DISABLED};
+            background-color: {BORDER_DISABLED};
         }}
         """
-    
-    @staticmethod
-    def groupbox() -> str:
-        """Windows 10 system groupbox"""
-        return f"""
+
+_GROUPBOX_QSS = """
         QGroupBox {{
             font-weight: normal;
-            color: {AppColors.TEXT_DEFAULT};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            margin-top: {AppDimensions.SPACING_LARGE}px;
-            padding-top: {AppDimensions.SPACING_MEDIUM}px;
-            background-color: {AppColors.BACKGROUND_LIGHT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
+            color: {TEXT_DEFAULT};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            margin-top: {SPACING_LARGE}px;
+            padding-top: {SPACING_MEDIUM}px;
+            background-color: {BACKGROUND_LIGHT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            border-radius: {BORDER_RADIUS_STANDARD}px;
         }}
         QGroupBox::title {{
             subcontrol-origin: margin;
-            left: {AppDimensions.SPACING_LARGE}px;
-            padding: 0 {AppDimensions.SPACING_MEDIUM}px;
-            background-color: {AppColors.BACKGROUND_LIGHT};
-            color: {AppColors.TEXT_DEFAULT};
+            left: {SPACING_LARGE}px;
+            padding: 0 {SPACING_MEDIUM}px;
+            background-color: {BACKGROUND_LIGHT};
+            color: {TEXT_DEFAULT};
         }}
         """
-    
-    @staticmethod
-    def textedit() -> str:
-        """Windows 10 system text edit"""
-        return f"""
+
+_TEXTEDIT_QSS = """
         QTextEdit {{
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            padding: {AppDimensions.PADDING_SMALL};
-            background-color: {AppColors.BACKGROUND_WHITE};
-            color: {AppColors.TEXT_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
-            selection-background-color: {AppColors.SELECTION_BG};
-            selection-color: {AppColors.SELECTION_TEXT};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            padding: {PADDING_SMALL};
+            background-color: {BACKGROUND_WHITE};
+            color: {TEXT_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            border-radius: {BORDER_RADIUS_STANDARD}px;
+            selection-background-color: {SELECTION_BG};
+            selection-color: {SELECTION_TEXT};
         }}
         QTextEdit:focus {{
-            border: {AppDimensions.BORDER_WIDTH_THICK}px solid {AppColors.BORDER_FOCUS};
+            border: {BORDER_WIDTH_THICK}px solid {BORDER_FOCUS};
             outline: none;
         }}
         QTextEdit:disabled {{
-            background-color: {AppColors.BACKGROUND_DISABLED};
-            color: {AppColors.TEXT_DISABLED};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DISABLED};
+            background-color: {BACKGROUND_DISABLED};
+            color: {TEXT_DISABLED};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DISABLED};
         }}
         """
-    
-    @staticmethod
-    def lineedit() -> str:
-        """Windows 10 system line edit"""
-        return f"""
+
+_LINEEDIT_QSS = """
         QLineEdit {{
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            padding: {AppDimensions.PADDING_SMALL};
-            background-color: {AppColors.BACKGROUND_WHITE};
-            color: {AppColors.TEXT_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            min-height: {AppDimensions.BUTTON_HEIGHT_SMALL}px;
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
-            selection-background-color: {AppColors.SELECTION_BG};
-            selection-color: {AppColors.SELECTION_TEXT};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            padding: {PADDING_SMALL};
+            background-color: {BACKGROUND_WHITE};
+            color: {TEXT_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            min-height: {BUTTON_HEIGHT_SMALL}px;
+            border-radius: {BORDER_RADIUS_STANDARD}px;
+            selection-background-color: {SELECTION_BG};
+            selection-color: {SELECTION_TEXT};
         }}
         QLineEdit:hover {{
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_FOCUS};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_FOCUS};
         }}
         QLineEdit:focus {{
-            border: {AppDimensions.BORDER_WIDTH_THICK}px solid {AppColors.BORDER_FOCUS};
+            border: {BORDER_WIDTH_THICK}px solid {BORDER_FOCUS};
             outline: none;
         }}
         QLineEdit:disabled {{
-            background-color: {AppColors.BACKGROUND_DISABLED};
-            color: {AppColors.TEXT_DISABLED};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DISABLED};
+            background-color: {BACKGROUND_DISABLED};
+            color: {TEXT_DISABLED};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DISABLED};
         }}
         """
-    
-    @staticmethod
-    def label() -> str:
-        """Standard label"""
-        return f"""
+
+_LABEL_QSS = """
         QLabel {{
-            color: {AppColors.TEXT_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
+            color: {TEXT_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
         }}
         """
-    
-    @staticmethod
-    def label_status() -> str:
-        """Status label with Windows 10 styling"""
-        return f"""
+
+_LABEL_STATUS_QSS = """
         QLabel {{
-            color: {AppColors.TEXT_DEFAULT};
-            padding: {AppDimensions.PADDING_SMALL} {AppDimensions.PADDING_LARGE};
-            background-color: {AppColors.BACKGROUND_LIGHT};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            min-height: {AppDimensions.BUTTON_HEIGHT_MEDIUM}px;
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
+            color: {TEXT_DEFAULT};
+            padding: {PADDING_SMALL} {PADDING_LARGE};
+            background-color: {BACKGROUND_LIGHT};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            min-height: {BUTTON_HEIGHT_MEDIUM}px;
+            border-radius: {BORDER_RADIUS_STANDARD}px;
         }}
         """
-    
-    @staticmethod
-    def listwidget() -> str:
-        """Windows 10 system list widget"""
-        return f"""
+
+
+_LISTWIDGET_QSS = """
         QListWidget {{
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            background-color: {AppColors.BACKGROUND_WHITE};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            padding: {AppDimensions.SPACING_TINY}px;
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            background-color: {BACKGROUND_WHITE};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            padding: {SPACING_TINY}px;
+            border-radius: {BORDER_RADIUS_STANDARD}px;
             outline: none;
         }}
         QListWidget::item {{
-            border-bottom: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_LIGHT};
-            padding: {AppDimensions.PADDING_SMALL};
+            border-bottom: {BORDER_WIDTH_STANDARD}px solid {BORDER_LIGHT};
+            padding: {PADDING_SMALL};
             margin: 1px 0px;
-            color: {AppColors.TEXT_DEFAULT};
+            color: {TEXT_DEFAULT};
             min-height: 18px;
         }}
         QListWidget::item:selected {{
-            background-color: {AppColors.SELECTION_BG};
-            color: {AppColors.SELECTION_TEXT};
+            background-color: {SELECTION_BG};
+            color: {SELECTION_TEXT};
         }}
         QListWidget::item:hover {{
-            background-color: {AppColors.BUTTON_HOVER};
+            background-color: {BUTTON_HOVER};
         }}
         QListWidget:focus {{
-            border: {AppDimensions.BORDER_WIDTH_THICK}px solid {AppColors.BORDER_FOCUS};
+            border: {BORDER_WIDTH_THICK}px solid {BORDER_FOCUS};
         }}
         """
-    
-    @staticmethod
-    def tablewidget() -> str:
-        """Windows 10 system table widget"""
-        return f"""
+
+_TABLEWIDGET_QSS = """
         QTableWidget {{
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            background-color: {AppColors.BACKGROUND_WHITE};
-            color: {AppColors.TEXT_DEFAULT};
-            gridline-color: {AppColors.BORDER_LIGHT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            background-color: {BACKGROUND_WHITE};
+            color: {TEXT_DEFAULT};
+            gridline-color: {BORDER_LIGHT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            border-radius: {BORDER_RADIUS_STANDARD}px;
             outline: none;
         }}
         QTableWidget::item {{
-            padding: {AppDimensions.PADDING_SMALL};
+            padding: {PADDING_SMALL};
             border: none;
         }}
         QTableWidget::item:selected {{
-            background-color: {AppColors.SELECTION_BG};
-            color: {AppColors.SELECTION_TEXT};
+            background-color: {SELECTION_BG};
+            color: {SELECTION_TEXT};
         }}
         QTableWidget::item:hover {{
-            background-color: {AppColors.BUTTON_HOVER};
+            background-color: {BUTTON_HOVER};
         }}
         QHeaderView::section {{
-            background-color: {AppColors.BACKGROUND_LIGHT};
-            color: {AppColors.TEXT_DEFAULT};
-            padding: {AppDimensions.PADDING_SMALL};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
+            background-color: {BACKGROUND_LIGHT};
+            color: {TEXT_DEFAULT};
+            padding: {PADDING_SMALL};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
             font-weight: bold;
         }}
         QTableWidget:focus {{
-            border: {AppDimensions.BORDER_WIDTH_THICK}px solid {AppColors.BORDER_FOCUS};
+            border: {BORDER_WIDTH_THICK}px solid {BORDER_FOCUS};
         }}
         """
-    
-    @staticmethod
-    def progress_bar() -> str:
-        """Windows 10 system progress bar"""
-        return f"""
+
+_PROGRESS_BAR_QSS = """
         QProgressBar {{
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            border-radius: {AppDimensions.BORDER_RADIUS_MODERN}px;
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            border-radius: {BORDER_RADIUS_MODERN}px;
             text-align: center;
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            min-height: {AppDimensions.HEIGHT_PROGRESS}px;
-            background-color: {AppColors.BACKGROUND_LIGHT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            min-height: {HEIGHT_PROGRESS}px;
+            background-color: {BACKGROUND_LIGHT};
         }}
         QProgressBar::chunk {{
-            background-color: {AppColors.ACCENT_BLUE};
-            border-radius: {AppDimensions.BORDER_RADIUS_MODERN - 1}px;
+            background-color: {ACCENT_BLUE};
+            border-radius: {BORDER_RADIUS_INNER}px;
         }}
         """
-    
-    @staticmethod
-    def scroll_area() -> str:
-        """Windows 10 system scroll area"""
-        return f"""
+
+_SCROLL_AREA_QSS = """
         QScrollArea {{
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            background-color: {AppColors.BACKGROUND_WHITE};
-            border-radius: {AppDimensions.BORDER_RADIUS_STANDARD}px;
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            background-color: {BACKGROUND_WHITE};
+            border-radius: {BORDER_RADIUS_STANDARD}px;
         }}
         QScrollBar:vertical {{
-            background-color: {AppColors.SCROLLBAR_BACKGROUND};
+            background-color: {SCROLLBAR_BACKGROUND};
             width: 16px;
             border-radius: 0px;
             border: none;
         }}
         QScrollBar::handle:vertical {{
-            background-color: {AppColors.BORDER_DEFAULT};
+            background-color: {BORDER_DEFAULT};
             border-radius: 0px;
             min-height: 20px;
         }}
         QScrollBar::handle:vertical:hover {{
-            background-color: {AppColors.BORDER_FOCUS};
+            background-color: {BORDER_FOCUS};
         }}
         QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
             border: none;
             background: none;
         }}
         """
+
+_TOOLTIP_QSS = """
+        QToolTip {{
+            background-color: {BACKGROUND_TOOLTIP};
+            color: {TEXT_TOOLTIP};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            padding: {PADDING_MEDIUM};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            border-radius: {BORDER_RADIUS_MODERN}px;
+        }}
+        """
+
+_STATUS_LABEL_INLINE_QSS = """
+        QLabel {{
+            color: {TEXT_DISABLED};
+            font-style: {ITALIC_STYLE};
+            margin-left: {PADDING_MEDIUM};
+        }}
+        """
+
+_PORT_LABEL_QSS = """
+        QLabel {{
+            font-weight: {BOLD_WEIGHT};
+            color: {TEXT_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+        }}
+        """
+
+_OUTPUT_PORT_WIDGET_QSS = """
+        OutputPortWidget {{
+            background-color: {BACKGROUND_WHITE};
+            padding: {PADDING_MEDIUM};
+            margin-bottom: {SPACING_SMALL}px;
+        }}
+        OutputPortWidget:hover {{
+            background-color: {BUTTON_HOVER};
+        }}
+        """
+
+_OUTPUT_PORT_WIDGET_PRESSED_QSS = """
+        OutputPortWidget {{
+            background-color: {BUTTON_PRESSED};
+            border: {BORDER_WIDTH_THICK}px solid {BORDER_FOCUS};
+        }}
+        """
+
+_OUTPUT_PORT_WIDGET_DISABLED_QSS = """
+        OutputPortWidget:disabled {{
+            background-color: {BACKGROUND_DISABLED};
+            border-color: {BORDER_DISABLED};
+        }}
+        """
+
+_BAUD_LABEL_QSS = """
+        QLabel {{
+            color: {TEXT_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            margin-right: {SPACING_SMALL}px;
+        }}
+        """
+
+_SECTION_HEADER_LABEL_QSS = """
+        QLabel {{
+            color: {TEXT_DEFAULT};
+            font-weight: {BOLD_WEIGHT};
+            margin-right: {SPACING_SMALL}px;
+        }}
+        """
+
+_SPLITTER_QSS = """
+        QSplitter::handle {{
+            background-color: {BORDER_LIGHT};
+            width: {SPACING_SMALL}px;
+            height: {SPACING_SMALL}px;
+        }}
+        QSplitter::handle:hover {{
+            background-color: {BORDER_FOCUS};
+        }}
+        """
+
+
+_NOTIFICATION_QSS = """
+        QLabel {{
+            background-color: {bg_color};
+            color: {text_color};
+            border: {BORDER_WIDTH_STANDARD}px solid {border_color};
+            border-radius: {BORDER_RADIUS_MODERN}px;
+            padding: {PADDING_MEDIUM};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+        }}
+        """
+
+_SEPARATOR_QSS = {
+    "horizontal": """
+            QFrame {{
+                color: {BORDER_LIGHT};
+                background-color: {BORDER_LIGHT};
+                max-height: {HEIGHT_SEPARATOR}px;
+            }}
+            """,
+    "vertical": """
+            QFrame {{
+                color: {BORDER_DEFAULT};
+                background-color: {BORDER_DEFAULT};
+                max-width: {BORDER_WIDTH_STANDARD}px;
+                margin: {PADDING_SMALL} {PADDING_MEDIUM};
+            }}
+            """,
+}
+
+_PORT_TYPE_INDICATOR_QSS = """
+        QLabel {{
+            color: {text_color};
+            font-style: {ITALIC_STYLE};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {SMALL_SIZE};
+            padding: {PADDING_SMALL} {PADDING_MEDIUM};
+            background-color: {bg_color};
+            border: {BORDER_WIDTH_STANDARD}px solid {border_color};
+            border-radius: {BORDER_RADIUS_MODERN}px;
+            margin-top: {SPACING_SMALL}px;
+        }}
+        """
+
+_ICON_BUTTON_HOVER_DANGER_QSS = """
+        QPushButton:hover {{
+            background-color: {ERROR_BACKGROUND};
+            border: {BORDER_WIDTH_STANDARD}px solid {ERROR_BORDER};
+        }}
+        """
+
+_GLOBAL_CHROME_QSS = """
+        /* Windows 10 Global Application Styling */
+        QApplication {{
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+        }}
+        
+        /* Windows 10 Tooltips */
+        {TOOLTIP_QSS}
+        
+        /* Windows 10 Menu Bar */
+        QMenuBar {{
+            background-color: {BACKGROUND_MENU};
+            color: {TEXT_MENU};
+            border-bottom: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+        }}
+        
+        QMenuBar::item {{
+            padding: 4px 8px;
+            background-color: transparent;
+            margin: 0px;
+        }}
+        
+        QMenuBar::item:selected {{
+            background-color: {SELECTION_MENU};
+            color: {SELECTION_TEXT};
+        }}
+        
+        QMenuBar::item:pressed {{
+            background-color: {BUTTON_PRESSED};
+        }}
+        
+        /* Windows 10 Context Menus */
+        QMenu {{
+            background-color: {BACKGROUND_MENU};
+            color: {TEXT_MENU};
+            border: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+            padding: 2px;
+        }}
+        
+        QMenu::item {{
+            padding: 4px 16px;
+            margin: 1px;
+        }}
+        
+        QMenu::item:selected {{
+            background-color: {SELECTION_MENU};
+            color: {SELECTION_TEXT};
+        }}
+        
+        QMenu::separator {{
+            height: 1px;
+            background-color: {BORDER_LIGHT};
+            margin: 2px 4px;
+        }}
+        
+        /* Windows 10 Status Bar */
+        QStatusBar {{
+            background-color: {BACKGROUND_LIGHT};
+            color: {TEXT_DEFAULT};
+            border-top: {BORDER_WIDTH_STANDARD}px solid {BORDER_DEFAULT};
+            font-family: {DEFAULT_FAMILY};
+            font-size: {DEFAULT_SIZE};
+        }}
+        
+        QStatusBar::item {{
+            border: none;
+        }}
+    """
+
+
+class AppStyles:
+    """Exact Windows 10 system stylesheets matching native controls
+
+    Stylesheet builders are memoized: colors and dimensions are constants, so
+    each variant is generated once and the same string is returned afterwards.
+    Results are interned, so equal stylesheets are one shared object; treat
+    them as read-only values.
+    """
+
+    @staticmethod
+    def reload_styles() -> None:
+        """Rebuild styles, colors and palette sources after changing theme constants
+        (then re-run ThemeManager.apply_global_stylesheet)"""
+        _fill_color_namespaces()
+        _ACCENT_QCOLORS.update(_collect_accent_qcolors())
+        _STYLE_VARS.update(_collect_style_vars())
+        _SEMANTIC_COLOR_MAP.update(_collect_semantic_colors())
+        _NOTIFICATION_COLORS.update(_collect_notification_colors())
+        IconManager.invalidate_cache()  # Rendered icons embed theme colors too
+        for attr in vars(AppStyles).values():
+            cached = getattr(attr, "__func__", attr)
+            if hasattr(cached, "cache_clear"):
+                cached.cache_clear()
+        _get_semantic_color.cache_clear()
+        _global_style.cache_clear()
+        # The baked theme.qss holds the old values; render the sheet from now on
+        global _baked_qss_enabled
+        _baked_qss_enabled = False
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def global_qss() -> str:
+        """Application-wide stylesheet; widgets opt in via their "variant" property"""
+        return sys.intern("".join(_scope_qss(build(), widget_class, variant)
+                                  for widget_class, variant, build in _GLOBAL_VARIANTS))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def application_qss() -> str:
+        """Complete application stylesheet: chrome rules followed by every widget variant"""
+        return sys.intern(_minify_qss(_global_style() + AppStyles.global_qss()))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def button(style_variant: str = "default") -> str:
+        """Windows 10 system button - exact match to native controls"""
+        template = _BUTTON_QSS + _BUTTON_VARIANT_QSS.get(style_variant, "")
+        return sys.intern(template.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def button_large() -> str:
+        """Large button for primary actions"""
+        return sys.intern(_BUTTON_LARGE_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def button_compact() -> str:
+        """Compact button for toolbars and space-constrained areas"""
+        return sys.intern(_BUTTON_COMPACT_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def icon_button() -> str:
+        """Icon-only button matching Windows 10 toolbar buttons"""
+        return sys.intern(_ICON_BUTTON_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def combobox() -> str:
+        """Windows 10 system combobox - exact native styling"""
+        return sys.intern(_COMBOBOX_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def checkbox() -> str:
+        """Windows 10 system checkbox - exact native appearance"""
+        return sys.intern(_CHECKBOX_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def groupbox() -> str:
+        """Windows 10 system groupbox"""
+        return sys.intern(_GROUPBOX_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def textedit() -> str:
+        """Windows 10 system text edit"""
+        return sys.intern(_TEXTEDIT_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def lineedit() -> str:
+        """Windows 10 system line edit"""
+        return sys.intern(_LINEEDIT_QSS.format_map(_STYLE_VARS))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def label() -> str:
+        """Standard label"""
+        return sys.intern(_LABEL_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def label_status() -> str:
+        """Status label with Windows 10 styling"""
+        return sys.intern(_LABEL_STATUS_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def listwidget() -> str:
+        """Windows 10 system list widget"""
+        return sys.intern(_LISTWIDGET_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def tablewidget() -> str:
+        """Windows 10 system table widget"""
+        return sys.intern(_TABLEWIDGET_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def progress_bar() -> str:
+        """Windows 10 system progress bar"""
+        return sys.intern(_PROGRESS_BAR_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def scroll_area() -> str:
+        """Windows 10 system scroll area"""
+        return sys.intern(_SCROLL_AREA_QSS.format_map(_STYLE_VARS))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
     def tooltip() -> str:
         """Windows 10 system tooltip"""
-        return f"""
-        QToolTip {{
-            background-color: {AppColors.BACKGROUND_TOOLTIP};
-            color: {AppColors.TEXT_TOOLTIP};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            padding: {AppDimensions.PADDING_MEDIUM};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            border-radius: {AppDimensions.BORDER_RADIUS_MODERN}px;
-        }}
-        """
+        return sys.intern(_TOOLTIP_QSS.format_map(_STYLE_VARS))
     
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def notification(notification_type: str = "info") -> str:
         """Windows 10 notification panel styles"""
-        type_colors = {
-            "success": (AppColors.SUCCESS_BACKGROUND, AppColors.SUCCESS_BORDER, AppColors.SUCCESS_PRIMARY),
-            "warning": (AppColors.WARNING_BACKGROUND, AppColors.WARNING_BORDER, AppColors.WARNING_PRIMARY),
-            "error": (AppColors.ERROR_BACKGROUND, AppColors.ERROR_BORDER, AppColors.ERROR_PRIMARY),
-            "info": (AppColors.INFO_BACKGROUND, AppColors.INFO_BORDER, AppColors.INFO_PRIMARY)
-        }
-        
-        bg_color, border_color, text_color = type_colors.get(notification_type, type_colors["info"])
+        bg_color, border_color, text_color = _NOTIFICATION_COLORS.get(
+            notification_type, _NOTIFICATION_COLORS["info"])
         
-        return f"""
-        QLabel {{
-            background-color: {bg_color};
-            color: {text_color};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {border_color};
-            border-radius: {AppDimensions.BORDER_RADIUS_MODERN}px;
-            padding: {AppDimensions.PADDING_MEDIUM};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-        }}
-        """
+        return sys.intern(_NOTIFICATION_QSS.format_map(
+            dict(_STYLE_VARS, bg_color=bg_color, border_color=border_color, text_color=text_color)))
     
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def separator(orientation: str = "horizontal") -> str:
         """Windows 10 separator line style"""
-        if orientation == "horizontal":
-            return f"""
-            QFrame {{
-                color: {AppColors.BORDER_LIGHT};
-                background-color: {AppColors.BORDER_LIGHT};
-                max-height: {AppDimensions.HEIGHT_SEPARATOR}px;
-            }}
-            """
-        else:  # vertical
-            return f"""
-            QFrame {{
-                color: {AppColors.BORDER_DEFAULT};
-                background-color: {AppColors.BORDER_DEFAULT};
-                max-width: {AppDimensions.BORDER_WIDTH_STANDARD}px;
-                margin: {AppDimensions.PADDING_SMALL} {AppDimensions.PADDING_MEDIUM};
-            }}
-            """
+        template = _SEPARATOR_QSS["horizontal" if orientation == "horizontal" else "vertical"]
+        return sys.intern(template.format_map(_STYLE_VARS))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def status_label_inline() -> str:
         """Inline status label style for section headers"""
-        return f"""
-        QLabel {{
-            color: {AppColors.TEXT_DISABLED};
-            font-style: {AppFonts.ITALIC_STYLE};
-            margin-left: {AppDimensions.PADDING_MEDIUM};
-        }}
-        """
+        return sys.intern(_STATUS_LABEL_INLINE_QSS.format_map(_STYLE_VARS))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def port_label() -> str:
         """Port number label style"""
-        return f"""
-        QLabel {{
-            font-weight: {AppFonts.BOLD_WEIGHT};
-            color: {AppColors.TEXT_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-        }}
-        """
+        return sys.intern(_PORT_LABEL_QSS.format_map(_STYLE_VARS))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def output_port_widget() -> str:
         """Output port widget container style"""
-        return f"""
-        OutputPortWidget {{
-            background-color: {AppColors.BACKGROUND_WHITE};
-            padding: {AppDimensions.PADDING_MEDIUM};
-            margin-bottom: {AppDimensions.SPACING_SMALL}px;
-        }}
-        OutputPortWidget:hover {{
-            background-color: {AppColors.BUTTON_HOVER};
-        }}
-        """
+        return sys.intern(_OUTPUT_PORT_WIDGET_QSS.format_map(_STYLE_VARS))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def output_port_widget_pressed() -> str:
         """Output port widget pressed state"""
-        return f"""
-        OutputPortWidget {{
-            background-color: {AppColors.BUTTON_PRESSED};
-            border: {AppDimensions.BORDER_WIDTH_THICK}px solid {AppColors.BORDER_FOCUS};
-        }}
-        """
+        return sys.intern(_OUTPUT_PORT_WIDGET_PRESSED_QSS.format_map(_STYLE_VARS))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def output_port_widget_disabled() -> str:
         """Output port widget disabled state"""
-        return f"""
-        OutputPortWidget:disabled {{
-            background-color: {AppColors.BACKGROUND_DISABLED};
-            border-color: {AppColors.BORDER_DISABLED};
-        }}
-        """
+        return sys.intern(_OUTPUT_PORT_WIDGET_DISABLED_QSS.format_map(_STYLE_VARS))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def output_port_widget_disabled_full() -> str:
+        """Output port widget style with the disabled state appended"""
+        return sys.intern(AppStyles.output_port_widget() + AppStyles.output_port_widget_disabled())
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
     def port_type_indicator(style_type: str = "info") -> str:
         """Port type indicator label style"""
-        from .theme import ThemeManager  # Local import to avoid circular dependency
-        bg_color = ThemeManager.get_semantic_color(style_type, "background")
-        border_color = ThemeManager.get_semantic_color(style_type, "border")
-        text_color = ThemeManager.get_semantic_color(style_type, "primary")
+        bg_color = _get_semantic_color(style_type, "background")
+        border_color = _get_semantic_color(style_type, "border")
+        text_color = _get_semantic_color(style_type, "primary")
         
-        return f"""
-        QLabel {{
-            color: {text_color};
-            font-style: {AppFonts.ITALIC_STYLE};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.SMALL_SIZE};
-            padding: {AppDimensions.PADDING_SMALL} {AppDimensions.PADDING_MEDIUM};
-            background-color: {bg_color};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {border_color};
-            border-radius: {AppDimensions.BORDER_RADIUS_MODERN}px;
-            margin-top: {AppDimensions.SPACING_SMALL}px;
-        }}
-        """
+        return sys.intern(_PORT_TYPE_INDICATOR_QSS.format_map(
+            dict(_STYLE_VARS, bg_color=bg_color, border_color=border_color, text_color=text_color)))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def baud_label() -> str:
         """Baud rate label style"""
-        return f"""
-        QLabel {{
-            color: {AppColors.TEXT_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            margin-right: {AppDimensions.SPACING_SMALL}px;
-        }}
-        """
+        return sys.intern(_BAUD_LABEL_QSS.format_map(_STYLE_VARS))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def section_header_label() -> str:
         """Section header label style"""
-        return f"""
-        QLabel {{
-            color: {AppColors.TEXT_DEFAULT};
-            font-weight: {AppFonts.BOLD_WEIGHT};
-            margin-right: {AppDimensions.SPACING_SMALL}px;
-        }}
-        """
+        return sys.intern(_SECTION_HEADER_LABEL_QSS.format_map(_STYLE_VARS))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def icon_button_hover_danger() -> str:
         """Icon button with danger hover effect"""
-        base = AppStyles.icon_button()
-        return base + f"""
-        QPushButton:hover {{
-            background-color: {AppColors.ERROR_BACKGROUND};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.ERROR_BORDER};
-        }}
-        """
+        return sys.intern(AppStyles.icon_button() + _ICON_BUTTON_HOVER_DANGER_QSS.format_map(_STYLE_VARS))
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def splitter() -> str:
         """Splitter widget style"""
-        return f"""
-        QSplitter::handle {{
-            background-color: {AppColors.BORDER_LIGHT};
-            width: {AppDimensions.SPACING_SMALL}px;
-            height: {AppDimensions.SPACING_SMALL}px;
-        }}
-        QSplitter::handle:hover {{
-            background-color: {AppColors.BORDER_FOCUS};
-        }}
-        """
+        return sys.intern(_SPLITTER_QSS.format_map(_STYLE_VARS))
+
+
+# Styles folded into AppStyles.global_qss(): (widget class, variant, builder).
+# Default labels are fully covered by the application palette and font, so they have no rule.
+_GLOBAL_VARIANTS = (
+    ("QPushButton", "default", lambda: AppStyles.button()),
+    ("QPushButton", "primary", lambda: AppStyles.button("primary")),
+    ("QPushButton", "success", lambda: AppStyles.button("success")),
+    ("QPushButton", "danger", lambda: AppStyles.button("danger")),
+    ("QPushButton", "large", AppStyles.button_large),
+    ("QPushButton", "compact", AppStyles.button_compact),
+    ("QPushButton", "icon", AppStyles.icon_button),
+    ("QPushButton", "icon_danger", AppStyles.icon_button_hover_danger),
+    ("QComboBox", "default", AppStyles.combobox),
+    ("QCheckBox", "default", AppStyles.checkbox),
+    ("QGroupBox", "default", AppStyles.groupbox),
+    ("QTextEdit", "default", AppStyles.textedit),
+    ("QLineEdit", "default", AppStyles.lineedit),
+    ("QListWidget", "default", AppStyles.listwidget),
+    ("QTableWidget", "default", AppStyles.tablewidget),
+    ("QProgressBar", "default", AppStyles.progress_bar),
+    ("QScrollArea", "default", AppStyles.scroll_area),
+    ("QSplitter", "default", AppStyles.splitter),
+    ("QFrame", "separator_horizontal", lambda: AppStyles.separator("horizontal")),
+    ("QFrame", "separator_vertical", lambda: AppStyles.separator("vertical")),
+    ("QLabel", "status", AppStyles.label_status),
+    ("QLabel", "status_inline", AppStyles.status_label_inline),
+    ("QLabel", "port", AppStyles.port_label),
+    ("QLabel", "baud", AppStyles.baud_label),
+    ("QLabel", "section_header", AppStyles.section_header_label),
+    ("QLabel", "notification_success", lambda: AppStyles.notification("success")),
+    ("QLabel", "notification_warning", lambda: AppStyles.notification("warning")),
+    ("QLabel", "notification_error", lambda: AppStyles.notification("error")),
+    ("QLabel", "notification_info", lambda: AppStyles.notification("info")),
+    ("QLabel", "port_type_success", lambda: AppStyles.port_type_indicator("success")),
+    ("QLabel", "port_type_warning", lambda: AppStyles.port_type_indicator("warning")),
+    ("QLabel", "port_type_error", lambda: AppStyles.port_type_indicator("error")),
+    ("QLabel", "port_type_info", lambda: AppStyles.port_type_indicator("info")),
+    ("OutputPortWidget", "default", AppStyles.output_port_widget),
+    ("OutputPortWidget", "pressed", AppStyles.output_port_widget_pressed),
+    ("OutputPortWidget", "disabled", AppStyles.output_port_widget_disabled_full),
+)
+
+_QSS_RULE_HEAD = re.compile(r"([^{}]+)\{")
+
+
+def _scope_qss(qss: str, widget_class: str, variant: str) -> str:
+    """Restrict every rule of a per-widget stylesheet to one variant of a widget class"""
+    scope = f'{widget_class}[variant="{variant}"]'
+
+    def scope_selector(selector: str) -> str:
+        selector = selector.strip()
+        if selector.startswith(widget_class):
+            return scope + selector[len(widget_class):]
+        return f"{scope} {selector}"
+
+    def scope_rule(match) -> str:
+        head = match.group(1)
+        selectors = head.strip()
+        indent = head[:len(head) - len(head.lstrip())]
+        return indent + ", ".join(scope_selector(s) for s in selectors.split(",")) + " {"
+
+    return _QSS_RULE_HEAD.sub(scope_rule, qss)
+
+
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_WHITESPACE = re.compile(r"\s+")
+_QSS_PUNCTUATION = re.compile(r" ?([{};:,>]) ?")
+
+
+def _minify_qss(qss: str) -> str:
+    """Drop comments and redundant whitespace, keeping one rule per line"""
+    qss = _QSS_WHITESPACE.sub(" ", _QSS_COMMENT.sub("", qss))
+    return _QSS_PUNCTUATION.sub(r"\1", qss).strip().replace("}", "}\n")
+
+
+# AppStyles.application_qss() pre-rendered by tools/bake_theme.py and shipped next to this module;
+# the bake keeps it pure ASCII so reading it back is a plain Latin-1 byte copy
+BAKED_QSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "theme.qss")
+_BAKED_QSS_HEADER = "/* Generated by tools/bake_theme.py from ui/theme/theme.py {inputs_hash} - do not edit */\n"
+# Cleared by AppStyles.reload_styles(), after which only the live sheet is current
+_baked_qss_enabled = True
+
+
+def _style_inputs_hash() -> str:
+    """Digest of what shapes the sheet: QSS templates, style variables and the variant table"""
+    digest = hashlib.sha1()
+    module_vars = globals()
+    for name in sorted(module_vars):
+        if name.endswith("_QSS"):
+            digest.update(f"{name}={module_vars[name]!r}\n".encode("utf-8"))
+    digest.update(repr(sorted(_STYLE_VARS.items())).encode("utf-8"))
+    digest.update(repr([(widget_class, variant) for widget_class, variant, _ in _GLOBAL_VARIANTS])
+                  .encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def baked_qss_header() -> str:
+    """First line theme.qss carries when baked from the current theme inputs"""
+    return _BAKED_QSS_HEADER.format(inputs_hash=_style_inputs_hash())
+
+
+def _read_baked_qss() -> Optional[str]:
+    """Contents of the baked theme.qss, or None when it is missing or stale"""
+    if not _baked_qss_enabled:
+        return None
+    qss_file = QFile(BAKED_QSS_PATH)
+    if not qss_file.open(QIODevice.OpenModeFlag.ReadOnly):
+        return None
+    try:
+        qss = qss_file.readAll().data().decode("latin-1")
+    finally:
+        qss_file.close()
+    # Templates or theme constants changed since the last bake; compare the
+    # header without its line ending so CRLF checkouts still match
+    if qss.split("\n", 1)[0].rstrip("\r") != baked_qss_header().rstrip("\n"):
+        return None
+    return qss
+
+
+@functools.lru_cache(maxsize=None)
+def _global_style() -> str:
+    """Application chrome stylesheet: tooltips, menus and the status bar (built on first use)"""
+    return sys.intern(_GLOBAL_CHROME_QSS.format_map(dict(_STYLE_VARS, TOOLTIP_QSS=AppStyles.tooltip())))
+
+
+# Four-state icons keyed by (AppIcons id, color, width, height); their pixmaps
+# come from AppIcons.rendered_pixmap, which owns the SVG renderer and pixmap caches
+_ICON_CACHE: Dict[Tuple[str, str, int, int], QIcon] = {}
+# Primary screen device pixel ratio, reset when the screen or its DPI changes
+_dpi_ratio: Optional[float] = None
+_dpi_watched_screen = None
 
 
 class IconManager:
     """Enhanced icon manager with Windows 10 system icon support"""
     
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Forget all built icons and pixmaps, e.g. after a theme switch"""
+        _ICON_CACHE.clear()
+        IconManager.emoji_pixmap.cache_clear()
+        _app_icons().clear_cache()
+    
     @staticmethod
     def get_scaled_size(base_size: int, scale_factor: float = 1.0) -> QSize:
         """Calculate scaled icon size based on Windows 10 DPI scaling"""
-        from PyQt6.QtWidgets import QApplication
+        return IconManager._scaled_size(base_size, scale_factor, IconManager._screen_dpi_ratio())
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _scaled_size(base_size: int, scale_factor: float, dpi_ratio: float) -> QSize:
+        scaled_size = int(base_size * (scale_factor * dpi_ratio))
+        return _ICON_SIZES.get(scaled_size) or QSize(scaled_size, scaled_size)
+    
+    @staticmethod
+    def _screen_dpi_ratio() -> float:
+        """Primary screen device pixel ratio, looked up once until the screen changes"""
+        global _dpi_ratio, _dpi_watched_screen
+        if _dpi_ratio is not None:
+            return _dpi_ratio
         
-        # Get screen DPI scaling if application exists
-        if QApplication.instance():
-            screen = QApplication.primaryScreen()
-            if screen:
-                dpi_ratio = screen.devicePixelRatio()
-                scale_factor *= dpi_ratio
+        from PyQt6.QtWidgets import QApplication
+        app = QApplication.instance()
+        screen = QApplication.primaryScreen() if app else None
+        if screen is None:
+            return 1.0  # No screen yet; look again next time
         
-        scaled_size = int(base_size * scale_factor)
-        return QSize(scaled_size, scaled_size)
+        if _dpi_watched_screen is None:
+            app.primaryScreenChanged.connect(IconManager._reset_dpi_ratio)
+        if screen is not _dpi_watched_screen:
+            screen.logicalDotsPerInchChanged.connect(IconManager._reset_dpi_ratio)
+            _dpi_watched_screen = screen
+        _dpi_ratio = screen.devicePixelRatio()
+        return _dpi_ratio
+    
+    @staticmethod
+    def _reset_dpi_ratio(*_args) -> None:
+        global _dpi_ratio
+        _dpi_ratio = None
     
     @staticmethod
-    def create_svg_icon(svg_template: str, color: str, size: QSize) -> QIcon:
-        """Create a QIcon from SVG template with Windows 10 native icon states"""
-        # Replace color placeholder in SVG
-        svg_data = svg_template.format(color=color)
+    def create_app_icon(icon_id: str, color: str, size: QSize) -> QIcon:
+        """Create a QIcon for a named AppIcons entry with Windows 10 native icon states"""
+        key = (icon_id, color, size.width(), size.height())
+        icon = _ICON_CACHE.get(key)
+        if icon is not None:
+            return icon
         
-        # Create QIcon with multiple states
+        app_icons = _app_icons()
         icon = QIcon()
-        
-        # Normal state
-        normal_pixmap = IconManager._svg_to_pixmap(svg_data, size)
-        icon.addPixmap(normal_pixmap, QIcon.Mode.Normal, QIcon.State.Off)
-        
-        # Hover state
-        hover_svg = svg_template.format(color=AppColors.ICON_HOVER)
-        hover_pixmap = IconManager._svg_to_pixmap(hover_svg, size)
-        icon.addPixmap(hover_pixmap, QIcon.Mode.Active, QIcon.State.Off)
-        
-        # Pressed state
-        pressed_svg = svg_template.format(color=AppColors.ICON_PRESSED)
-        pressed_pixmap = IconManager._svg_to_pixmap(pressed_svg, size)
-        icon.addPixmap(pressed_pixmap, QIcon.Mode.Selected, QIcon.State.Off)
-        
-        # Disabled state
-        disabled_svg = svg_template.format(color=AppColors.ICON_DISABLED)
-        disabled_pixmap = IconManager._svg_to_pixmap(disabled_svg, size)
-        icon.addPixmap(disabled_pixmap, QIcon.Mode.Disabled, QIcon.State.Off)
-        
+        for mode, state_color in ((QIcon.Mode.Normal, color),
+                                  (QIcon.Mode.Active, AppColors.ICON_HOVER),
+                                  (QIcon.Mode.Selected, AppColors.ICON_PRESSED),
+                                  (QIcon.Mode.Disabled, AppColors.ICON_DISABLED)):
+            icon.addPixmap(app_icons.rendered_pixmap(icon_id, size, state_color), mode, QIcon.State.Off)
+        _ICON_CACHE[key] = icon
         return icon
     
     @staticmethod
     def create_combobox_arrow_icon(size: QSize) -> QIcon:
         """Create Windows 10 system combobox dropdown arrow"""
-        return IconManager.create_svg_icon(AppIcons.DROPDOWN_ARROW, AppColors.ICON_DEFAULT, size)
+        return IconManager.create_app_icon("DROPDOWN_ARROW", AppColors.ICON_DEFAULT, size)
     
     @staticmethod
     def create_checkbox_check_icon(size: QSize) -> QIcon:
         """Create Windows 10 system checkbox checkmark"""
-        return IconManager.create_svg_icon(AppIcons.CHECKBOX_CHECK, AppColors.TEXT_WHITE, size)
+        return IconManager.create_app_icon("CHECKBOX_CHECK", AppColors.TEXT_WHITE, size)
     
     @staticmethod
-    def _svg_to_pixmap(svg_data: str, size: QSize) -> QPixmap:
-        """Convert SVG data to QPixmap"""
-        renderer = QSvgRenderer()
-        renderer.load(svg_data.encode('utf-8'))
-        
-        pixmap = QPixmap(size)
-        pixmap.fill(QColor(0, 0, 0, 0))  # Transparent background
+    @functools.lru_cache(maxsize=None)
+    def emoji_pixmap(emoji: str, size: int, dpr: float = 1.0) -> QPixmap:
+        """Render an emoji glyph once into a transparent size x size pixmap"""
+        pixmap = QPixmap(round(size * dpr), round(size * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
         
+        font = QFont(AppFonts.DEFAULT_FAMILY)
+        font.setPixelSize(max(1, int(size * 0.85)))
         painter = QPainter(pixmap)
-        renderer.render(painter)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 0, size, size), Qt.AlignmentFlag.AlignCenter, emoji)
         painter.end()
         
         return pixmap
 
 
+class PortTypeIndicator(QLabel):
+    """Port type label that draws its emoji from a cached pixmap beside plain text"""
+    
+    ICON_GAP = 4
+    
+    def __init__(self, text: str = "", parent: Optional[QWidget] = None):
+        super().__init__(text, parent)
+        self._emoji_pixmap = None
+    
+    def set_port_type(self, message: str):
+        """Show an AppMessages.PORT_TYPE_* message"""
+        parts = _PORT_TYPE_PARTS.get(message)
+        if parts is None:
+            self.clear_port_type()
+            self.setText(message)
+            return
+        
+        emoji, text = parts
+        self.ensurePolished()  # Size the emoji from the stylesheet font
+        size = self.fontMetrics().height()
+        self._emoji_pixmap = IconManager.emoji_pixmap(emoji, size, self.devicePixelRatioF())
+        # Indent rather than contents margins: the stylesheet box (padding, border,
+        # margin-top) is applied through the margins and must stay intact
+        self.setIndent(size + self.ICON_GAP)
+        self.setText(text)
+    
+    def clear_port_type(self):
+        """Drop the emoji pixmap"""
+        self._emoji_pixmap = None
+        self.setIndent(-1)
+        self.setText("")
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._emoji_pixmap is None:
+            return
+        rect = self.contentsRect()
+        size = self.fontMetrics().height()
+        
+        # Line up with the first text line, wherever the alignment puts the (wrapped) block
+        text_height = size
+        if self.wordWrap():
+            margins = self.contentsMargins()
+            text_height = max(size, self.heightForWidth(self.width()) - margins.top() - margins.bottom())
+        alignment = self.alignment()
+        if alignment & Qt.AlignmentFlag.AlignTop:
+            top = rect.top()
+        elif alignment & Qt.AlignmentFlag.AlignBottom:
+            top = rect.bottom() + 1 - text_height
+        else:
+            top = rect.top() + (rect.height() - text_height) // 2
+        
+        painter = QPainter(self)
+        painter.drawPixmap(rect.left(), top, self._emoji_pixmap)
+        painter.end()
+
+
+def _collect_accent_qcolors() -> Dict[str, QColor]:
+    """Accent colors by name, taken from the prebuilt AppQColors values"""
+    return {
+        'blue': AppQColors.ACCENT_BLUE,
+        'green': AppQColors.ACCENT_GREEN,
+        'orange': AppQColors.ACCENT_ORANGE,
+        'red': AppQColors.ACCENT_RED,
+        'purple': AppQColors.ACCENT_PURPLE,
+        'magenta': AppQColors.ACCENT_MAGENTA,
+        'yellow': AppQColors.ACCENT_YELLOW,
+        'teal': AppQColors.ACCENT_TEAL,
+        'pair_highlight': AppQColors.PAIR_HIGHLIGHT,
+        'pair_info': AppQColors.PAIR_INFO,
+    }
+
+
+_ACCENT_QCOLORS = _collect_accent_qcolors()
+
+# Button variant implied by a create_button style_type; "standard" uses the variant argument
+_BUTTON_VARIANT_BY_TYPE: Dict[str, str] = {
+    "large": "large",
+    "compact": "compact",
+    "icon": "icon",
+}
+
+# Unscaled icon edge length for each create_icon_button size name
+_ICON_BASE_SIZES: Dict[str, int] = {
+    "small": AppDimensions.ICON_SIZE_SMALL,
+    "medium": AppDimensions.ICON_SIZE_MEDIUM,
+    "large": AppDimensions.ICON_SIZE_LARGE,
+    "xlarge": AppDimensions.ICON_SIZE_XLARGE,
+}
+
+# set_widget_margins margin types, built once as QMargins
+_QMARGINS: Dict[str, QMargins] = {
+    "dialog": QMargins(*AppDimensions.MARGIN_DIALOG),
+    "control": QMargins(*AppDimensions.MARGIN_CONTROL),
+    "small": QMargins(*AppDimensions.MARGIN_SMALL),
+    "none": QMargins(*AppDimensions.MARGIN_NONE),
+    "standard": QMargins(*AppDimensions.MARGIN_DIALOG),
+}
+
+
 class ThemeManager:
     """Enhanced theme manager with Windows 10 system accuracy"""
-    
+
+    @staticmethod
+    def set_variant(widget: QWidget, variant: str = "default") -> None:
+        """Select a widget's rule set in the global stylesheet (see AppStyles.global_qss)"""
+        if widget.property("variant") == variant:
+            return
+        widget.setProperty("variant", variant)
+        # Property selectors are only re-evaluated when the widget is re-polished
+        if widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
     # Widget factory methods with exact Windows 10 specifications
     @staticmethod
     def create_button(text: str, callback: Optional[Callable] = None, 
@@ -1074,15 +1697,11 @@ class ThemeManager:
         """Create Windows 10 system-accurate button"""
         button = QPushButton(text)
         
-        # Apply appropriate style based on type
-        if style_type == "large":
-            button.setStyleSheet(AppStyles.button_large())
-        elif style_type == "compact":
-            button.setStyleSheet(AppStyles.button_compact())
-        elif style_type == "icon":
-            button.setStyleSheet(AppStyles.icon_button())
-        else:  # standard
-            button.setStyleSheet(AppStyles.button(variant))
+        # Select the matching rule set of the global stylesheet; unknown variants
+        # have no rules there and fall back to the default button style
+        if variant not in _BUTTON_VARIANT_QSS:
+            variant = "default"
+        ThemeManager.set_variant(button, _BUTTON_VARIANT_BY_TYPE.get(style_type, variant))
         
         button.setEnabled(enabled)
         if callback:
@@ -1095,7 +1714,7 @@ class ThemeManager:
         """Create Windows 10 system-accurate combobox"""
         combo = QComboBox()
         combo.setEditable(editable)
-        combo.setStyleSheet(AppStyles.combobox())
+        ThemeManager.set_variant(combo)
         
         # Set minimum height to match Windows 10 system comboboxes
         combo.setMinimumHeight(AppDimensions.COMBOBOX_HEIGHT)
@@ -1106,34 +1725,28 @@ class ThemeManager:
     def create_checkbox(text: str) -> QCheckBox:
         """Create Windows 10 system-accurate checkbox"""
         checkbox = QCheckBox(text)
-        checkbox.setStyleSheet(AppStyles.checkbox())
+        ThemeManager.set_variant(checkbox)
         return checkbox
     
     @staticmethod
     def create_groupbox(title: str) -> QGroupBox:
         """Create Windows 10 system-accurate groupbox"""
         group = QGroupBox(title)
-        group.setStyleSheet(AppStyles.groupbox())
+        ThemeManager.set_variant(group)
         return group
     
     @staticmethod
     def create_label(text: str, style_type: str = "standard") -> QLabel:
         """Create styled label"""
         label = QLabel(text)
-        
-        style_map = {
-            "standard": AppStyles.label(),
-            "status": AppStyles.label_status(),
-        }
-        label.setStyleSheet(style_map.get(style_type, AppStyles.label()))
-        
+        ThemeManager.set_variant(label, "status" if style_type == "status" else "default")
         return label
     
     @staticmethod
     def create_textedit(font_type: str = "standard") -> QTextEdit:
         """Create Windows 10 system-accurate text edit"""
         textedit = QTextEdit()
-        textedit.setStyleSheet(AppStyles.textedit())
+        ThemeManager.set_variant(textedit)
         
         if font_type == "console":
             textedit.setFont(AppFonts.CONSOLE)
@@ -1146,28 +1759,28 @@ class ThemeManager:
     def create_lineedit() -> QLineEdit:
         """Create Windows 10 system-accurate line edit"""
         lineedit = QLineEdit()
-        lineedit.setStyleSheet(AppStyles.lineedit())
+        ThemeManager.set_variant(lineedit)
         return lineedit
     
     @staticmethod
     def create_listwidget() -> QListWidget:
         """Create Windows 10 system-accurate list widget"""
         listwidget = QListWidget()
-        listwidget.setStyleSheet(AppStyles.listwidget())
+        ThemeManager.set_variant(listwidget)
         return listwidget
     
     @staticmethod
     def create_tablewidget() -> QTableWidget:
         """Create Windows 10 system-accurate table widget"""
         tablewidget = QTableWidget()
-        tablewidget.setStyleSheet(AppStyles.tablewidget())
+        ThemeManager.set_variant(tablewidget)
         return tablewidget
     
     @staticmethod
     def create_progress_bar() -> QProgressBar:
         """Create Windows 10 system-accurate progress bar"""
         progress = QProgressBar()
-        progress.setStyleSheet(AppStyles.progress_bar())
+        ThemeManager.set_variant(progress)
         return progress
     
     @staticmethod
@@ -1176,26 +1789,20 @@ class ThemeManager:
         button = QPushButton()
         
         # Get base size
-        size_map = {
-            "small": AppDimensions.ICON_SIZE_SMALL,
-            "medium": AppDimensions.ICON_SIZE_MEDIUM,
-            "large": AppDimensions.ICON_SIZE_LARGE,
-            "xlarge": AppDimensions.ICON_SIZE_XLARGE
-        }
-        base_size = size_map.get(size, AppDimensions.ICON_SIZE_MEDIUM)
+        base_size = _ICON_BASE_SIZES.get(size, AppDimensions.ICON_SIZE_MEDIUM)
         
         # Calculate scaled size
         icon_size = IconManager.get_scaled_size(base_size)
         
-        # Get SVG template
-        icon_template = getattr(AppIcons, icon_name.upper(), None)
-        if icon_template:
-            icon = IconManager.create_svg_icon(icon_template, AppColors.ICON_DEFAULT, icon_size)
+        # Render the named SVG icon
+        icon_id = icon_name.upper()
+        if getattr(_app_icons(), icon_id, None):
+            icon = IconManager.create_app_icon(icon_id, AppColors.ICON_DEFAULT, icon_size)
             button.setIcon(icon)
             button.setIconSize(icon_size)
         
         # Apply styling
-        button.setStyleSheet(AppStyles.icon_button())
+        ThemeManager.set_variant(button, "icon")
         
         if tooltip:
             button.setToolTip(tooltip)
@@ -1206,7 +1813,9 @@ class ThemeManager:
     def create_notification_label(text: str, notification_type: str = "info") -> QLabel:
         """Create Windows 10 notification label"""
         label = QLabel(text)
-        label.setStyleSheet(AppStyles.notification(notification_type))
+        if notification_type not in _SEMANTIC_TYPES:
+            notification_type = "info"
+        ThemeManager.set_variant(label, f"notification_{notification_type}")
         return label
     
     @staticmethod
@@ -1218,36 +1827,37 @@ class ThemeManager:
         else:
             separator.setFrameShape(QFrame.Shape.VLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setStyleSheet(AppStyles.separator(orientation))
+        ThemeManager.set_variant(separator, "separator_horizontal" if orientation == "horizontal"
+                                 else "separator_vertical")
         return separator
     
     @staticmethod
     def create_status_label_inline(text: str) -> QLabel:
         """Create inline status label for section headers"""
         label = QLabel(text)
-        label.setStyleSheet(AppStyles.status_label_inline())
+        ThemeManager.set_variant(label, "status_inline")
         return label
     
     @staticmethod
     def create_port_label(number: int) -> QLabel:
         """Create port number label"""
-        label = QLabel(AppMessages.BUTTON_PORT_LABEL.format(number=number))
+        label = QLabel(port_label_text(number))
         label.setFixedWidth(AppDimensions.WIDTH_LABEL_PORT)
-        label.setStyleSheet(AppStyles.port_label())
+        ThemeManager.set_variant(label, "port")
         return label
     
     @staticmethod
     def create_baud_label(text: str = "Baud:") -> QLabel:
         """Create baud rate label"""
         label = QLabel(text)
-        label.setStyleSheet(AppStyles.baud_label())
+        ThemeManager.set_variant(label, "baud")
         return label
     
     @staticmethod
     def create_section_header_label(text: str) -> QLabel:
         """Create section header label"""
         label = QLabel(text)
-        label.setStyleSheet(AppStyles.section_header_label())
+        ThemeManager.set_variant(label, "section_header")
         return label
     
     @staticmethod
@@ -1259,11 +1869,11 @@ class ThemeManager:
         return btn
     
     @staticmethod
-    def create_port_type_indicator() -> QLabel:
+    def create_port_type_indicator() -> PortTypeIndicator:
         """Create port type indicator label"""
-        label = QLabel("")
+        label = PortTypeIndicator("")
         label.setWordWrap(True)
-        label.setStyleSheet(AppStyles.port_type_indicator())
+        ThemeManager.set_variant(label, "port_type_info")
         label.setVisible(False)
         return label
     
@@ -1283,10 +1893,15 @@ class ThemeManager:
     @staticmethod
     def configure_scroll_area(scroll_area, max_height: Optional[int] = None):
         """Configure a scroll area with proper styling"""
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet(AppStyles.scroll_area())
+        # Only touch what differs; fresh scroll areas already use the as-needed policies
+        if not scroll_area.widgetResizable():
+            scroll_area.setWidgetResizable(True)
+        as_needed = Qt.ScrollBarPolicy.ScrollBarAsNeeded
+        if scroll_area.horizontalScrollBarPolicy() != as_needed:
+            scroll_area.setHorizontalScrollBarPolicy(as_needed)
+        if scroll_area.verticalScrollBarPolicy() != as_needed:
+            scroll_area.setVerticalScrollBarPolicy(as_needed)
+        ThemeManager.set_variant(scroll_area)
         if max_height:
             scroll_area.setMaximumHeight(max_height)
         return scroll_area
@@ -1297,22 +1912,14 @@ class ThemeManager:
         from PyQt6.QtWidgets import QSplitter
         splitter = QSplitter(orientation)
         splitter.setChildrenCollapsible(False)
-        splitter.setStyleSheet(AppStyles.splitter())
+        ThemeManager.set_variant(splitter)
         return splitter
     
     @staticmethod
     def set_widget_margins(widget, margin_type: str = "standard"):
         """Set widget margins based on type"""
-        margin_map = {
-            "dialog": AppDimensions.MARGIN_DIALOG,
-            "control": AppDimensions.MARGIN_CONTROL,
-            "small": AppDimensions.MARGIN_SMALL,
-            "none": AppDimensions.MARGIN_NONE,
-            "standard": AppDimensions.MARGIN_DIALOG
-        }
-        margins = margin_map.get(margin_type, AppDimensions.MARGIN_DIALOG)
         if hasattr(widget, 'setContentsMargins'):
-            widget.setContentsMargins(*margins)
+            widget.setContentsMargins(_QMARGINS.get(margin_type, _QMARGINS["dialog"]))
     
     @staticmethod
     def create_dialog_window(title: str, width: Optional[int] = None, height: Optional[int] = None):
@@ -1346,135 +1953,67 @@ class ThemeManager:
     @staticmethod
     def get_accent_color(color_type: str) -> QColor:
         """Get Windows 10 accent colors"""
-        colors = {
-            'blue': AppColors.ACCENT_BLUE,
-            'green': AppColors.ACCENT_GREEN,
-            'orange': AppColors.ACCENT_ORANGE,
-            'red': AppColors.ACCENT_RED,
-            'purple': AppColors.ACCENT_PURPLE,
-            'magenta': AppColors.ACCENT_MAGENTA,
-            'yellow': AppColors.ACCENT_YELLOW,
-            'teal': AppColors.ACCENT_TEAL,
-            'pair_highlight': AppColors.PAIR_HIGHLIGHT,
-            'pair_info': AppColors.PAIR_INFO
-        }
-        color_hex = colors.get(color_type, AppColors.ACCENT_BLUE)
-        return QColor(color_hex)
+        # Copy so callers can't alter the shared table entry
+        return QColor(_ACCENT_QCOLORS.get(color_type, AppQColors.ACCENT_BLUE))
     
     @staticmethod
     def get_semantic_color(semantic_type: str, element: str = "primary") -> str:
         """Get semantic colors for Windows 10 notifications"""
-        color_map = {
-            "success": {
-                "primary": AppColors.SUCCESS_PRIMARY,
-                "background": AppColors.SUCCESS_BACKGROUND,
-                "border": AppColors.SUCCESS_BORDER
-            },
-            "warning": {
-                "primary": AppColors.WARNING_PRIMARY,
-                "background": AppColors.WARNING_BACKGROUND,
-                "border": AppColors.WARNING_BORDER
-            },
-            "error": {
-                "primary": AppColors.ERROR_PRIMARY,
-                "background": AppColors.ERROR_BACKGROUND,
-                "border": AppColors.ERROR_BORDER
-            },
-            "info": {
-                "primary": AppColors.INFO_PRIMARY,
-                "background": AppColors.INFO_BACKGROUND,
-                "border": AppColors.INFO_BORDER
-            }
-        }
+        return _get_semantic_color(semantic_type, element)
+    
+    @staticmethod
+    def create_palette() -> QPalette:
+        """Application palette carrying the theme colors that need no stylesheet"""
+        palette = QPalette()
+        roles = (
+            (QPalette.ColorRole.Window, AppQColors.BACKGROUND_LIGHT),
+            (QPalette.ColorRole.WindowText, AppQColors.TEXT_DEFAULT),
+            (QPalette.ColorRole.Base, AppQColors.BACKGROUND_WHITE),
+            (QPalette.ColorRole.AlternateBase, AppQColors.GRAY_50),
+            (QPalette.ColorRole.Text, AppQColors.TEXT_DEFAULT),
+            (QPalette.ColorRole.PlaceholderText, AppQColors.TEXT_DISABLED),
+            (QPalette.ColorRole.Button, AppQColors.BUTTON_DEFAULT),
+            (QPalette.ColorRole.ButtonText, AppQColors.TEXT_DEFAULT),
+            (QPalette.ColorRole.BrightText, AppQColors.TEXT_WHITE),
+            (QPalette.ColorRole.Light, AppQColors.BUTTON_HIGHLIGHT),
+            (QPalette.ColorRole.Mid, AppQColors.BORDER_DEFAULT),
+            (QPalette.ColorRole.Dark, AppQColors.BORDER_DARK_SHADOW),
+            (QPalette.ColorRole.Highlight, AppQColors.SELECTION_BG),
+            (QPalette.ColorRole.HighlightedText, AppQColors.SELECTION_TEXT),
+            (QPalette.ColorRole.ToolTipBase, AppQColors.BACKGROUND_TOOLTIP),
+            (QPalette.ColorRole.ToolTipText, AppQColors.TEXT_TOOLTIP),
+            (QPalette.ColorRole.Link, AppQColors.HOT_TRACKING),
+        )
+        for role, color in roles:
+            palette.setColor(QPalette.ColorGroup.Active, role, color)
+            palette.setColor(QPalette.ColorGroup.Inactive, role, color)
+            palette.setColor(QPalette.ColorGroup.Disabled, role, color)
         
-        return color_map.get(semantic_type, color_map["info"]).get(element, AppColors.INFO_PRIMARY)
+        # Disabled controls use GrayText on the disabled background
+        for role in (QPalette.ColorRole.WindowText, QPalette.ColorRole.Text,
+                     QPalette.ColorRole.ButtonText):
+            palette.setColor(QPalette.ColorGroup.Disabled, role, AppQColors.TEXT_DISABLED)
+        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Base, AppQColors.BACKGROUND_DISABLED)
+        return palette
     
     @staticmethod
     def apply_global_stylesheet(app) -> None:
         """Apply Windows 10 system-accurate global stylesheet"""
-        global_style = f"""
-        /* Windows 10 Global Application Styling */
-        QApplication {{
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-        }}
-        
-        /* Windows 10 Tooltips */
-        {AppStyles.tooltip()}
-        
-        /* Windows 10 Menu Bar */
-        QMenuBar {{
-            background-color: {AppColors.BACKGROUND_MENU};
-            color: {AppColors.TEXT_MENU};
-            border-bottom: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-        }}
-        
-        QMenuBar::item {{
-            padding: 4px 8px;
-            background-color: transparent;
-            margin: 0px;
-        }}
-        
-        QMenuBar::item:selected {{
-            background-color: {AppColors.SELECTION_MENU};
-            color: {AppColors.SELECTION_TEXT};
-        }}
-        
-        QMenuBar::item:pressed {{
-            background-color: {AppColors.BUTTON_PRESSED};
-        }}
-        
-        /* Windows 10 Context Menus */
-        QMenu {{
-            background-color: {AppColors.BACKGROUND_MENU};
-            color: {AppColors.TEXT_MENU};
-            border: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-            padding: 2px;
-        }}
-        
-        QMenu::item {{
-            padding: 4px 16px;
-            margin: 1px;
-        }}
-        
-        QMenu::item:selected {{
-            background-color: {AppColors.SELECTION_MENU};
-            color: {AppColors.SELECTION_TEXT};
-        }}
-        
-        QMenu::separator {{
-            height: 1px;
-            background-color: {AppColors.BORDER_LIGHT};
-            margin: 2px 4px;
-        }}
-        
-        /* Windows 10 Status Bar */
-        QStatusBar {{
-            background-color: {AppColors.BACKGROUND_LIGHT};
-            color: {AppColors.TEXT_DEFAULT};
-            border-top: {AppDimensions.BORDER_WIDTH_STANDARD}px solid {AppColors.BORDER_DEFAULT};
-            font-family: {AppFonts.DEFAULT_FAMILY};
-            font-size: {AppFonts.DEFAULT_SIZE};
-        }}
-        
-        QStatusBar::item {{
-            border: none;
-        }}
-        """
+        # Plain colors and the default font go through the palette, not the QSS parser
+        app.setPalette(ThemeManager.create_palette())
+        app.setFont(QFont(AppFonts.DEFAULT_FAMILY, AppFonts.DEFAULT_POINT_SIZE))
         
-        app.setStyleSheet(global_style)
+        # Chrome and widget styles in one sheet, widgets selecting theirs through
+        # the "variant" property; prefer the baked copy and fall back to rendering it here
+        app.setStyleSheet(_read_baked_qss() or AppStyles.application_qss())
 
 
 # Configuration constants that should be in the theme
 class Config:
     """Application configuration constants using theme system"""
-    BAUD_RATES = ["1200", "2400", "4800", "9600", "14400", "19200", 
-                  "38400", "57600", "115200", "230400", "460800", "921600"]
-    QUICK_BAUD_RATES = ["9600", "19200", "38400", "57600", "115200"]
-    DEFAULT_BAUD = "115200"
-    MIN_OUTPUT_PORTS = AppDimensions.OUTPUT_PORT_MIN_COUNT
+    BAUD_RATES: Final = ("1200", "2400", "4800", "9600", "14400", "19200",
+                         "38400", "57600", "115200", "230400", "460800", "921600")
+    QUICK_BAUD_RATES: Final = ("9600", "19200", "38400", "57600", "115200")
+    DEFAULT_BAUD: Final = "115200"
+    MIN_OUTPUT_PORTS: Final = AppDimensions.OUTPUT_PORT_MIN_COUNT
 
@@ -11,8 +11,8 @@ from PyQt6.QtCore import Qt, pyqtSignal
 
 from core.components import PortConfig, SerialPortInfo
 from ui.theme.theme import (
-    ThemeManager, AppStyles, AppDimensions, AppColors, AppFonts, 
-    AppMessages, Config
+    ThemeManager, AppDimensions, AppColors, AppFonts, 
+    AppMessages, Config, port_label_text
 )
 
 
@@ -27,7 +27,7 @@ class OutputPortWidget(QWidget):
         self.scanned_ports: List[SerialPortInfo] = []
         
         # Apply widget styling from theme
-        self.setStyleSheet(AppStyles.output_port_widget())
+        ThemeManager.set_variant(self)
         
         self.init_ui(available_ports)
     
@@ -74,8 +74,7 @@ class OutputPortWidget(QWidget):
             "small"
         )
         # Apply danger hover style
-        current_style = self.remove_btn.styleSheet()
-        self.remove_btn.setStyleSheet(AppStyles.icon_button_hover_danger())
+        ThemeManager.set_variant(self.remove_btn, "icon_danger")
         layout.addWidget(self.remove_btn)
         
         main_layout.addLayout(layout)
@@ -189,14 +188,14 @@ class OutputPortWidget(QWidget):
             
             # Use theme messages and apply appropriate style
             if port_info.is_moxa:
-                self.port_type_label.setText(AppMessages.PORT_TYPE_MOXA)
-                self.port_type_label.setStyleSheet(AppStyles.port_type_indicator("warning"))
+                self.port_type_label.set_port_type(AppMessages.PORT_TYPE_MOXA)
+                ThemeManager.set_variant(self.port_type_label, "port_type_warning")
             elif port_info.port_type == "Physical":
-                self.port_type_label.setText(AppMessages.PORT_TYPE_PHYSICAL)
-                self.port_type_label.setStyleSheet(AppStyles.port_type_indicator("success"))
+                self.port_type_label.set_port_type(AppMessages.PORT_TYPE_PHYSICAL)
+                ThemeManager.set_variant(self.port_type_label, "port_type_success")
             else:
-                self.port_type_label.setText(AppMessages.PORT_TYPE_VIRTUAL)
-                self.port_type_label.setStyleSheet(AppStyles.port_type_indicator("info"))
+                self.port_type_label.set_port_type(AppMessages.PORT_TYPE_VIRTUAL)
+                ThemeManager.set_variant(self.port_type_label, "port_type_info")
         else:
             self.port_type_label.setVisible(False)
     
@@ -222,7 +221,7 @@ class OutputPortWidget(QWidget):
     def renumber(self, new_number: int):
         """Update the port number after reordering"""
         self.port_number = new_number
-        self.label.setText(AppMessages.BUTTON_PORT_LABEL.format(number=new_number))
+        self.label.setText(port_label_text(new_number))
         self.remove_btn.setToolTip(f"Remove port {new_number}")
     
     def setEnabled(self, enabled: bool):
@@ -231,10 +230,9 @@ class OutputPortWidget(QWidget):
         
         # Apply disabled styling from theme
         if not enabled:
-            current_style = self.styleSheet()
-            self.setStyleSheet(current_style + AppStyles.output_port_widget_disabled())
+            ThemeManager.set_variant(self, "disabled")
         else:
-            self.setStyleSheet(AppStyles.output_port_widget())
+            ThemeManager.set_variant(self)
         
         # Enable/disable child widgets
         self.port_combo.setEnabled(enabled)
@@ -243,11 +241,11 @@ class OutputPortWidget(QWidget):
     
     def mousePressEvent(self, event):
         """Handle mouse press for visual feedback"""
-        self.setStyleSheet(AppStyles.output_port_widget_pressed())
+        ThemeManager.set_variant(self, "pressed")
         super().mousePressEvent(event)
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release to restore normal state"""
         # Restore normal styling from theme
-        self.setStyleSheet(AppStyles.output_port_widget())
+        ThemeManager.set_variant(self)
         super().mouseReleaseEvent(event)
\ No newline at end of file